@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the daily reminder entry point.
+
+The reminder runs as a fresh process each morning, so interpreter start plus imports is a
+large share of every run. This checks three things against the budgets below and exits
+non-zero if any regress:
+
+    import overhead    median cumulative -X importtime of `import send_reminder`, minus
+                       the median of a bare interpreter's imports        <= 50 ms
+    dry-run overhead   median wall time of `send_reminder.py --dry-run --date ...`, minus
+                       the median of `python -c pass`                    <= 100 ms
+    lazy imports       none of FORBIDDEN_ON_DRY_RUN is imported by a dry run
+
+Usage:
+    python benchmarks/startup.py [--runs 15] [--import-budget-ms 50] [--run-budget-ms 100]
+
+src/ is byte-compiled first, as a deployed checkout would be, so that a stale or missing
+.pyc (e.g. under PYTHONDONTWRITEBYTECODE) isn't timed as import cost.
+"""
+
+import argparse
+import compileall
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+IMPORT_BUDGET_MS = 50.0
+RUN_BUDGET_MS = 100.0
+
+# Modules only the send path (or optional features) may pull in.
+FORBIDDEN_ON_DRY_RUN = ["subprocess", "http.client", "concurrent.futures", "sqlite3", "numpy"]
+
+
+def _importtime(code: list[str]) -> list[tuple[str, int]]:
+    """Run a command under -X importtime; return (module, cumulative us) per import line.
+
+    Nested imports keep their leading indentation in the module name.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *code], cwd=SRC, capture_output=True, text=True, check=True
+    )
+    lines = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        lines.append((name[1:].rstrip(), int(cumulative)))
+    return lines
+
+
+def _top_level_us(lines: list[tuple[str, int]]) -> int:
+    return sum(us for name, us in lines if not name.startswith(" "))
+
+
+def _median_import_us(code: list[str], runs: int) -> float:
+    return statistics.median(_top_level_us(_importtime(code)) for _ in range(runs))
+
+
+def _median_wall_ms(cmd: list[str], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reminder cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--run-budget-ms", type=float, default=RUN_BUDGET_MS)
+    parser.add_argument("--date", default="2026-03-02", help="Date to render for the dry run")
+    args = parser.parse_args()
+
+    compileall.compile_dir(SRC, quiet=1)
+    bare = _median_import_us(["-c", "pass"], args.runs)
+    imports = _median_import_us(["-c", "import send_reminder"], args.runs)
+    import_ms = (imports - bare) / 1000
+
+    dry_run = ["src/send_reminder.py", "--dry-run", "--date", args.date]
+    loaded = {name.strip() for name, _ in _importtime([str(ROOT / dry_run[0]), *dry_run[1:]])}
+    leaked = [m for m in FORBIDDEN_ON_DRY_RUN if m in loaded]
+
+    interpreter_ms = _median_wall_ms([sys.executable, "-c", "pass"], args.runs)
+    run_ms = _median_wall_ms([sys.executable, *dry_run], args.runs) - interpreter_ms
+
+    result = {
+        "import_overhead_ms": round(import_ms, 1),
+        "import_budget_ms": args.import_budget_ms,
+        "dry_run_overhead_ms": round(run_ms, 1),
+        "dry_run_budget_ms": args.run_budget_ms,
+        "interpreter_ms": round(interpreter_ms, 1),
+        "eager_modules": leaked,
+    }
+    print(json.dumps(result, indent=2))
+
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import overhead {import_ms:.1f} ms > {args.import_budget_ms} ms")
+    if run_ms > args.run_budget_ms:
+        failures.append(f"dry-run overhead {run_ms:.1f} ms > {args.run_budget_ms} ms")
+    if leaked:
+        failures.append(f"dry run imported {', '.join(leaked)}")
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Hot-path benchmarks over synthetic roadmaps (1k-100k milestones) and multi-year histories.
+
+Results are written as JSON so runs from different commits can be compared:
+
+    python benchmarks/suite.py --output before.json
+    (change something)
+    python benchmarks/suite.py --output after.json --compare before.json
+
+--compare exits non-zero when any operation got slower than --threshold times its baseline.
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import progress
+import reports
+import roadmap
+import send_reminder
+from synthetic import make_progress, make_roadmap
+
+try:
+    import forecast
+except ImportError:  # needs numpy
+    forecast = None
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+BENCH_DATE = date(2027, 3, 1)  # a Monday, so the weekly summary path runs too
+
+
+def _time(fn, min_runs: int = 5, max_runs: int = 50, max_seconds: float = 2.0) -> list[float]:
+    """Time fn min_runs..max_runs times, stopping early for slow ops; return per-run ms."""
+    runs = []
+    started = time.perf_counter()
+    for _ in range(max_runs):
+        t0 = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - t0) * 1000)
+        elapsed = time.perf_counter() - started
+        if elapsed > max_seconds or (len(runs) >= min_runs and elapsed > max_seconds / 4):
+            break
+    return runs
+
+
+def _use_roadmap(milestones: list[dict], phases: dict) -> None:
+    # Modules import these objects by name, so swap contents in place.
+    roadmap.ROADMAP[:] = milestones
+    roadmap.PHASES.clear()
+    roadmap.PHASES.update(phases)
+
+
+def run_size(size: int, history_days: int, workdir: Path) -> list[dict]:
+    milestones, phases = make_roadmap(size)
+    data = make_progress(milestones, history_days=history_days)
+    _use_roadmap(milestones, phases)
+
+    progress.DATA_DIR = workdir
+    progress.PROGRESS_FILE = workdir / f"progress-{size}.json"
+    progress.LOCK_FILE = workdir / ".progress.lock"
+    progress.ARCHIVE_FILE = workdir / "progress_archive.json"
+    progress.save_progress(data)
+    loaded = progress.load_progress()
+    today = BENCH_DATE
+    toggle = milestones[size // 2]["id"]
+
+    ops = {
+        "load_progress": progress.load_progress,
+        "save_progress": lambda: progress.save_progress(loaded),
+        "get_stats": lambda: progress.get_stats(loaded),
+        "phase_stats": lambda: progress.phase_stats(loaded),
+        "toggle_and_stats": lambda: (
+            progress.set_completed(loaded, toggle, not progress.is_completed(loaded, toggle), today),
+            progress.get_stats(loaded),
+        ),
+        "get_active_milestones": lambda: roadmap.get_active_milestones(today),
+        "get_overdue": lambda: send_reminder.get_overdue(today, loaded),
+        "get_upcoming_deadlines": lambda: send_reminder.get_upcoming_deadlines(today, loaded),
+        "get_weekly_summary": lambda: send_reminder.get_weekly_summary(today, loaded),
+        "quarterly_report": lambda: reports.quarterly_report(loaded, today),
+        "build_message": lambda: send_reminder.build_message(today),
+        "render_range_365": lambda: send_reminder.render_range(today, today + timedelta(days=364), io.StringIO()),
+    }
+    if forecast is not None:
+        ops["forecast"] = lambda: forecast.simulate(loaded, today, milestones, phases, seed=0)
+    results = []
+    for name, fn in ops.items():
+        runs = _time(fn)
+        results.append({
+            "op": name,
+            "size": size,
+            "history_days": history_days,
+            "runs": len(runs),
+            "median_ms": round(statistics.median(runs), 3),
+            "min_ms": round(min(runs), 3),
+        })
+        print(f"{size:>7} {name:<24} {statistics.median(runs):10.3f} ms", file=sys.stderr)
+    return results
+
+
+def _commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current: list[dict], baseline_path: Path, threshold: float) -> list[str]:
+    """Ops that got slower than threshold x their baseline median."""
+    with open(baseline_path) as f:
+        baseline = {(r["op"], r["size"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in current:
+        old = baseline.get((r["op"], r["size"]))
+        if old is None or old["median_ms"] == 0:
+            continue
+        ratio = r["median_ms"] / old["median_ms"]
+        print(f"{r['size']:>7} {r['op']:<24} {old['median_ms']:10.3f} -> {r['median_ms']:10.3f} ms  x{ratio:.2f}",
+              file=sys.stderr)
+        if ratio > threshold:
+            regressions.append(f"{r['op']} @ {r['size']}: x{ratio:.2f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Roadmap hot-path benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--history-days", type=int, default=3 * 365)
+    parser.add_argument("--output", type=str, help="Write results JSON here (default stdout)")
+    parser.add_argument("--compare", type=str, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    original = (list(roadmap.ROADMAP), dict(roadmap.PHASES))
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            for size in args.sizes:
+                results += run_size(size, args.history_days, Path(tmp))
+        finally:
+            _use_roadmap(*original)
+
+    report = {
+        "meta": {
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(results, Path(args.compare), args.threshold)
+        for r in regressions:
+            print(f"REGRESSION: {r}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Synthetic roadmaps and progress histories for benchmarks.
+"""
+
+import random
+from datetime import date, timedelta
+
+from progress import SCHEMA_VERSION
+from roadmap import MilestoneIndex
+
+
+def make_roadmap(size: int, phases: int = 12, start: date = date(2026, 1, 1), seed: int = 0) -> tuple[list[dict], dict]:
+    """Return (ROADMAP, PHASES) with size milestones spread over phases consecutive quarters."""
+    rnd = random.Random(seed)
+    phase_map = {}
+    for p in range(phases):
+        p_start = start + timedelta(days=91 * p)
+        phase_map[f"phase-{p}"] = {"label": f"Phase {p}", "start": p_start, "end": p_start + timedelta(days=90)}
+
+    keys = list(phase_map)
+    roadmap = []
+    for i in range(size):
+        key = keys[i * phases // size]
+        phase = phase_map[key]
+        m_start = phase["start"] + timedelta(days=rnd.randint(0, 60))
+        m_end = m_start + timedelta(days=rnd.randint(14, 120))
+        m = {
+            "id": f"m{i:06d}",
+            "phase": key,
+            "title": f"Synthetic milestone {i}",
+            "daily_action": f"Work on milestone {i} (30 min)",
+            "start": m_start,
+            "end": m_end,
+        }
+        if rnd.random() < 0.15:
+            m["daily_action"] = None
+            m["deadline"] = m_end
+        roadmap.append(m)
+    return roadmap, phase_map
+
+
+def make_progress(
+    roadmap: list[dict],
+    history_days: int = 3 * 365,
+    end: date = date(2029, 1, 1),
+    completed_fraction: float = 0.3,
+    checkin_rate: float = 0.7,
+    max_checkins: int = 8,
+    seed: int = 0,
+) -> dict:
+    """Current-schema progress with some completions and a daily_log covering history_days up to end."""
+    rnd = random.Random(seed)
+    progress = {}
+    for m in roadmap:
+        if m["end"] < end and rnd.random() < completed_fraction:
+            done = m["start"] + timedelta(days=rnd.randint(0, (m["end"] - m["start"]).days))
+            progress[m["id"]] = {"completed": True, "completed_date": done.isoformat()}
+        else:
+            progress[m["id"]] = {"completed": False, "completed_date": None}
+
+    index = MilestoneIndex([m for m in roadmap if m.get("daily_action")])
+    log = {}
+    day = end - timedelta(days=history_days)
+    while day < end:
+        if rnd.random() < checkin_rate:
+            active = index.active_on(day)
+            picked = rnd.sample(active, min(len(active), rnd.randint(1, max_checkins)))
+            if picked:
+                log[day.isoformat()] = [m["id"] for m in picked]
+        day += timedelta(days=1)
+    progress["daily_log"] = log
+    progress["schema_version"] = SCHEMA_VERSION
+    return progress
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Streak and history analytics over daily_log, computed once in Python instead of per render.
+
+Per-day results are cached and only recomputed for days whose check-ins changed, so
+re-running after a new day is logged costs one day of work.
+
+Usage:
+    python analytics.py                         # Write docs/stats.json for today (ET)
+    python analytics.py --date 2026-03-01 --output stats.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from progress import DATA_DIR, atomic_write, is_completed, load_progress
+from roadmap import ROADMAP, MilestoneIndex
+
+DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+STATS_FILE = DOCS_DIR / "stats.json"
+CACHE_FILE = DATA_DIR / ".cache" / "analytics-days.json"
+
+HEATMAP_WEEKS = 16
+BREAKDOWN_WEEKS = 4
+
+
+@dataclass(frozen=True)
+class DayStat:
+    checked: int  # check-ins logged that day
+    hits: int  # check-ins for tasks actually active that day
+    possible: int  # daily tasks active that day
+
+    @property
+    def perfect(self) -> bool:
+        return self.possible > 0 and self.hits == self.possible
+
+    def level(self) -> int:
+        """Heatmap intensity 0-4, matching the dashboard's buckets."""
+        if self.possible == 0 or self.checked == 0:
+            return 0
+        pct = self.checked / self.possible
+        if pct <= 0.25:
+            return 1
+        if pct <= 0.5:
+            return 2
+        return 3 if pct < 1 else 4
+
+
+def _roadmap_signature(milestones: list[dict]) -> str:
+    """Fingerprint of the fields per-day stats depend on, stable across processes."""
+    h = hashlib.sha1()
+    for m in milestones:
+        h.update(f"{m['id']}|{m['start']}|{m['end']}|{bool(m.get('daily_action'))}\n".encode())
+    return h.hexdigest()
+
+
+class HistoryAnalytics:
+    """Per-day check-in stats over a roadmap, extended incrementally as daily_log grows."""
+
+    def __init__(self, milestones: list[dict] | None = None):
+        self.milestones = ROADMAP if milestones is None else milestones
+        self._tasks = MilestoneIndex([m for m in self.milestones if m.get("daily_action")])
+        self._signature = _roadmap_signature(self.milestones)
+        self._days: dict[str, DayStat] = {}
+        self._seen: dict[str, tuple] = {}  # the check-ins each cached day was computed from
+
+    def day(self, day: date, daily_log: dict) -> DayStat:
+        """Stats for one day, computing and caching them if its check-ins changed."""
+        key = day.isoformat()
+        ids = tuple(daily_log.get(key, ()))
+        if self._seen.get(key) != ids or key not in self._days:
+            active = {m["id"] for m in self._tasks.active_on(day)}
+            logged = set(ids)
+            self._days[key] = DayStat(len(ids), len(logged & active), len(active))
+            self._seen[key] = ids
+        return self._days[key]
+
+    def update(self, daily_log: dict, today: date) -> None:
+        """Bring every logged day up to today into the cache."""
+        today_key = today.isoformat()
+        for key in daily_log:
+            if key <= today_key:
+                self.day(date.fromisoformat(key), daily_log)
+
+    def summary(self, progress: dict, today: date) -> dict:
+        """Dashboard stats as of today: streaks, totals, heatmap and recent weeks."""
+        log = progress.get("daily_log", {})
+        self.update(log, today)
+        today_key = today.isoformat()
+        logged = sorted(k for k in log if k <= today_key)
+
+        # Best streak: longest run of consecutive calendar days with any check-in.
+        best = run = 0
+        prev = None
+        for key in logged:
+            if not log[key]:
+                run, prev = 0, None
+                continue
+            d = date.fromisoformat(key)
+            run = run + 1 if prev is not None and d - prev == timedelta(days=1) else 1
+            prev = d
+            best = max(best, run)
+
+        # Current streak: today counts once all of today's open tasks are ticked,
+        # then every consecutive earlier day with at least one check-in.
+        open_today = [m["id"] for m in self._tasks.active_on(today) if not is_completed(progress, m["id"])]
+        checked_today = set(log.get(today_key, ()))
+        prior = 0
+        d = today - timedelta(days=1)
+        while log.get(d.isoformat()):
+            prior += 1
+            d -= timedelta(days=1)
+        current = prior + (1 if open_today and all(mid in checked_today for mid in open_today) else 0)
+
+        sunday = today - timedelta(days=(today.weekday() + 1) % 7)
+        heat_start = sunday - timedelta(weeks=HEATMAP_WEEKS - 1)
+        heatmap = []
+        for n in range(HEATMAP_WEEKS * 7):
+            d = heat_start + timedelta(days=n)
+            if d > today:
+                heatmap.append(None)
+            else:
+                stat = self.day(d, log)
+                heatmap.append([stat.checked, stat.possible, stat.level()])
+
+        weeks = []
+        for w in range(BREAKDOWN_WEEKS):
+            start = sunday - timedelta(weeks=w)
+            days = []
+            for n in range(7):
+                d = start + timedelta(days=n)
+                stat = self.day(d, log)
+                days.append(None if d > today else [stat.hits, stat.possible])
+            weeks.append({"start": start.isoformat(), "days": days})
+
+        return {
+            "date": today_key,
+            "current_streak": current,
+            "prior_streak": prior,  # run ending yesterday, so clients can add today live
+            "best_streak": max(best, current),
+            "perfect_days": sum(1 for k in logged if self._days[k].perfect),
+            "total_checkins": sum(len(log[k]) for k in logged),
+            "days_tracked": sum(1 for k in logged if log[k]),
+            "heatmap": {"start": heat_start.isoformat(), "cells": heatmap},
+            "weeks": weeks,
+        }
+
+    def save_cache(self, path: Path | None = None) -> None:
+        path = path or CACHE_FILE
+        data = {
+            "signature": self._signature,
+            "days": {k: [list(self._seen[k]), s.checked, s.hits, s.possible] for k, s in self._days.items()},
+        }
+        atomic_write(path, json.dumps(data, separators=(",", ":")))
+
+    def load_cache(self, path: Path | None = None) -> None:
+        """Reuse per-day results from an earlier run, unless the roadmap has changed since."""
+        path = path or CACHE_FILE
+        if not path.exists():
+            return
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("signature") != self._signature:
+            return
+        for key, (ids, checked, hits, possible) in data["days"].items():
+            self._seen[key] = tuple(ids)
+            self._days[key] = DayStat(checked, hits, possible)
+
+
+def write_stats(stats: dict, path: Path | None = None) -> Path:
+    path = path or STATS_FILE
+    atomic_write(path, json.dumps(stats, separators=(",", ":")) + "\n")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute dashboard history stats")
+    parser.add_argument("--date", type=str, help="Compute as of this date (YYYY-MM-DD); default today in ET")
+    parser.add_argument("--output", type=str, help=f"Where to write the stats (default {STATS_FILE})")
+    args = parser.parse_args()
+
+    if args.date:
+        today = datetime.strptime(args.date, "%Y-%m-%d").date()
+    else:
+        today = datetime.now(ZoneInfo("America/New_York")).date()
+
+    analytics = HistoryAnalytics()
+    analytics.load_cache()
+    stats = analytics.summary(load_progress(), today)
+    analytics.save_cache()
+    path = write_stats(stats, Path(args.output) if args.output else None)
+    print(f"Wrote {path}: {stats['current_streak']} day streak, {stats['perfect_days']} perfect days")
+
+
+if __name__ == "__main__":
+    main()
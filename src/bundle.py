@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Builds the static data bundle the dashboard loads instead of the raw progress file.
+
+The bundle holds the roadmap, completion state, active daily tasks for the next few days,
+the last week of check-ins and precomputed history stats. It is written to
+docs/data/bundle.<hash>.json, so unchanged data keeps its filename (and browser cache);
+docs/data/manifest.json names the current one.
+
+Usage:
+    python bundle.py                    # Build for today (ET)
+    python bundle.py --date 2026-03-01
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from analytics import HistoryAnalytics
+from progress import atomic_write, load_progress
+from roadmap import PHASES, ROADMAP, get_index
+
+BUNDLE_VERSION = 1
+BUNDLE_DIR = Path(__file__).resolve().parent.parent / "docs" / "data"
+MANIFEST_FILE = BUNDLE_DIR / "manifest.json"
+
+ACTIVE_HORIZON_DAYS = 7  # the page keeps working this long without a rebuild
+RECENT_LOG_DAYS = 7
+
+
+def build_bundle(progress: dict, today: date) -> dict:
+    """The dashboard's data for today, as a compact JSON-ready dict."""
+    positions = {m["id"]: i for i, m in enumerate(ROADMAP)}
+    index = get_index()
+
+    roadmap = []
+    for m in ROADMAP:
+        item = {
+            "id": m["id"],
+            "phase": m["phase"],
+            "title": m["title"],
+            "daily_action": m.get("daily_action"),
+            "start": m["start"].isoformat(),
+            "end": m["end"].isoformat(),
+        }
+        if m.get("deadline"):
+            item["deadline"] = m["deadline"].isoformat()
+        roadmap.append(item)
+
+    # Only completed milestones are listed: id -> completed_date
+    completed = {
+        m["id"]: progress[m["id"]].get("completed_date")
+        for m in ROADMAP
+        if progress.get(m["id"], {}).get("completed")
+    }
+
+    # Daily tasks active on each upcoming date, as positions in roadmap
+    active = {}
+    for n in range(ACTIVE_HORIZON_DAYS + 1):
+        d = today + timedelta(days=n)
+        active[d.isoformat()] = [positions[m["id"]] for m in index.active_on(d) if m.get("daily_action")]
+
+    log = progress.get("daily_log", {})
+    recent_from = (today - timedelta(days=RECENT_LOG_DAYS)).isoformat()
+    recent_log = {day: ids for day, ids in sorted(log.items()) if day >= recent_from and ids}
+
+    return {
+        "version": BUNDLE_VERSION,
+        "date": today.isoformat(),
+        "phases": [{"key": key, "label": p["label"], "start": p["start"].isoformat(), "end": p["end"].isoformat()}
+                   for key, p in PHASES.items()],
+        "roadmap": roadmap,
+        "completed": completed,
+        "active": active,
+        "recent_log": recent_log,
+        "stats": HistoryAnalytics().summary(progress, today),
+    }
+
+
+def write_bundle(bundle: dict, out_dir: Path | None = None) -> Path:
+    """Write bundle under its content hash, point the manifest at it and drop stale bundles."""
+    out_dir = out_dir or BUNDLE_DIR
+    text = json.dumps(bundle, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(text.encode()).hexdigest()[:12]
+    name = f"bundle.{digest}.json"
+    path = out_dir / name
+    if not path.exists():
+        atomic_write(path, text)
+    manifest = {"version": BUNDLE_VERSION, "bundle": name}
+    atomic_write(out_dir / MANIFEST_FILE.name, json.dumps(manifest, separators=(",", ":")) + "\n")
+    for old in out_dir.glob("bundle.*.json"):
+        if old.name != name:
+            old.unlink()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the dashboard data bundle")
+    parser.add_argument("--date", type=str, help="Build as of this date (YYYY-MM-DD); default today in ET")
+    parser.add_argument("--output-dir", type=str, help=f"Directory for bundle + manifest (default {BUNDLE_DIR})")
+    args = parser.parse_args()
+
+    if args.date:
+        today = datetime.strptime(args.date, "%Y-%m-%d").date()
+    else:
+        today = datetime.now(ZoneInfo("America/New_York")).date()
+
+    path = write_bundle(build_bundle(load_progress(), today), Path(args.output_dir) if args.output_dir else None)
+    print(f"Wrote {path} ({path.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
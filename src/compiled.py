@@ -0,0 +1,123 @@
+"""
+Struct-of-arrays form of the roadmap, queried with NumPy instead of per-milestone loops.
+
+Needs numpy (pip install numpy); nothing on the default send path imports this module.
+"""
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+
+import numpy as np
+
+from roadmap import ROADMAP
+from snapshot import DaySnapshot
+from urgency import UrgencyRanker
+
+NEVER = np.iinfo(np.int32).min  # ordinal for "no completion date"
+
+
+class _Picked(Sequence):
+    """Read-only view of milestones[i] for i in an index array, without building a list."""
+
+    def __init__(self, milestones: list[dict], positions: np.ndarray):
+        self._milestones = milestones
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._milestones[i] for i in self._positions[item].tolist()]
+        return self._milestones[int(self._positions[item])]
+
+    def __iter__(self):
+        return (self._milestones[i] for i in self._positions.tolist())
+
+
+class CompiledRoadmap:
+    """Milestone dates as int32 ordinal arrays, plus a due-date ordering for range queries."""
+
+    def __init__(self, milestones: list[dict]):
+        self.milestones = milestones
+        self.size = len(milestones)
+        self.start = np.fromiter((m["start"].toordinal() for m in milestones), np.int32, self.size)
+        self.end = np.fromiter((m["end"].toordinal() for m in milestones), np.int32, self.size)
+        self.due = np.fromiter(((m.get("deadline") or m["end"]).toordinal() for m in milestones), np.int32, self.size)
+        self.has_action = np.fromiter((bool(m.get("daily_action")) for m in milestones), bool, self.size)
+
+    def completion(self, progress: dict) -> tuple[np.ndarray, np.ndarray]:
+        """(completed bitmask, completed_date ordinals with NEVER for none) for progress."""
+        done = np.zeros(self.size, bool)
+        completed_on = np.full(self.size, NEVER, np.int32)
+        for i, m in enumerate(self.milestones):
+            entry = progress.get(m["id"])
+            if not entry:
+                continue
+            done[i] = bool(entry.get("completed", False))
+            cd = entry.get("completed_date")
+            if cd:
+                completed_on[i] = date.fromisoformat(cd).toordinal()
+        return done, completed_on
+
+    def snapshots(self, dates, progress: dict, upcoming_days: int = 7, block: int = 64,
+                  ranker: UrgencyRanker | None = None):
+        """Yield a DaySnapshot for every date in dates, evaluating a block of dates at a time."""
+        dates = list(dates)
+        if ranker is None and dates:
+            ranker = UrgencyRanker(progress, first=min(dates), last=max(dates))
+        done, completed_on = self.completion(progress)
+        pending = ~done
+        completed = int(done.sum())
+
+        # Incomplete milestones ordered by (due, position) answer the upcoming window by bisection.
+        pending_pos = np.flatnonzero(pending)
+        order = pending_pos[np.argsort(self.due[pending_pos], kind="stable")]
+        due_sorted = self.due[order]
+
+        days = np.fromiter((d.toordinal() for d in dates), np.int32, len(dates))
+        lo = np.searchsorted(due_sorted, days, "left")
+        hi = np.searchsorted(due_sorted, days + upcoming_days, "right")
+
+        for first in range(0, len(dates), block):
+            col = days[first:first + block, None]
+            active = (self.start <= col) & (col <= self.end) & pending
+            overdue = (self.due < col) & pending
+            for row in range(len(col)):
+                k = first + row
+                today = dates[k]
+                up = order[lo[k]:hi[k]]
+                snap = DaySnapshot(
+                    today=today,
+                    active=_Picked(self.milestones, np.flatnonzero(active[row])),
+                    overdue=_Picked(self.milestones, np.flatnonzero(overdue[row])),
+                    upcoming=[(self.milestones[i], date.fromordinal(int(self.due[i]))) for i in up.tolist()],
+                    completed=completed,
+                    total=self.size,
+                    ranker=ranker,
+                )
+                if today.weekday() == 0:
+                    t = days[k]
+                    week = np.flatnonzero((completed_on >= t - 7) & (completed_on <= t))
+                    snap.completed_last_week = [self.milestones[i]["title"] for i in week.tolist()]
+                yield snap
+
+    def snapshot(self, today: date, progress: dict, upcoming_days: int = 7) -> DaySnapshot:
+        return next(self.snapshots([today], progress, upcoming_days))
+
+
+_compiled: CompiledRoadmap | None = None
+
+
+def compile_roadmap(milestones: list[dict] | None = None) -> CompiledRoadmap:
+    """Compiled arrays for milestones (default ROADMAP), cached until the list changes."""
+    global _compiled
+    if milestones is None:
+        milestones = ROADMAP
+    if _compiled is None or _compiled.milestones is not milestones or _compiled.size != len(milestones):
+        _compiled = CompiledRoadmap(milestones)
+    return _compiled
+
+
+def date_range(first: date, last: date) -> list[date]:
+    return [first + timedelta(days=n) for n in range((last - first).days + 1)]
@@ -0,0 +1,181 @@
+"""
+Pushover delivery over pooled keep-alive connections, fanned out across threads.
+
+Set PUSHOVER_API_URL to point the client at a local stand-in for testing;
+tests/pushover_stub.py is one.
+"""
+
+import http.client
+import json
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urlsplit
+
+PUSHOVER_URL = "https://api.pushover.net/1/messages.json"
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of delivering one notification to one recipient."""
+
+    recipient: str
+    ok: bool
+    attempts: int
+    status: int | None = None  # last HTTP status, None if no response arrived
+    request_id: str | None = None
+    error: str | None = None
+
+
+class _RetryableError(Exception):
+    def __init__(self, message: str, status: int | None = None, wait: float | None = None):
+        super().__init__(message)
+        self.status = status
+        self.wait = wait
+
+
+def _seconds_until(value: str | None) -> float | None:
+    """Seconds to wait for a Retry-After value: delay-seconds or an HTTP-date (RFC 9110).
+
+    None if the header is missing or unreadable.
+    """
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class PushoverClient:
+    """Sends Pushover messages, reusing up to `workers` persistent connections.
+
+    Network errors and 5xx responses are retried with jittered exponential backoff.
+    A 429 pauses every worker until the provider's reset time (Retry-After or
+    X-Limit-App-Reset) before retrying. Other 4xx responses fail immediately.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        url: str | None = None,
+        workers: int = 8,
+        retries: int = 3,
+        timeout: float = 10.0,
+        backoff: float = 0.5,
+        max_wait: float = 60.0,
+    ):
+        self.token = token
+        self.url = url or os.getenv("PUSHOVER_API_URL", PUSHOVER_URL)
+        parts = urlsplit(self.url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path or "/"
+        self.workers = workers
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_wait = max_wait
+        self._pool: queue.LifoQueue = queue.LifoQueue()
+        self._paused_until = 0.0
+        self._pause_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _connection(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            return cls(self._host, self._port, timeout=self.timeout)
+
+    def _pause(self, seconds: float) -> None:
+        with self._pause_lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + min(seconds, self.max_wait))
+
+    def _wait_if_paused(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _post(self, fields: dict) -> tuple[int, dict]:
+        body = urlencode(fields).encode()
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        conn = self._connection()
+        try:
+            conn.request("POST", self._path, body=body, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise _RetryableError(f"{type(e).__name__}: {e}") from e
+        self._pool.put(conn)
+
+        try:
+            payload = json.loads(raw) if raw else {}
+        except ValueError:
+            payload = {}
+        if resp.status == 429:
+            seconds = _seconds_until(resp.getheader("Retry-After"))
+            if seconds is None:
+                try:
+                    seconds = float(resp.getheader("X-Limit-App-Reset")) - time.time()  # epoch seconds
+                except (TypeError, ValueError):
+                    seconds = self.backoff
+            self._pause(max(seconds, 0.0))
+            raise _RetryableError("rate limited", status=429, wait=0.0)
+        if resp.status >= 500:
+            raise _RetryableError(f"HTTP {resp.status}", status=resp.status)
+        return resp.status, payload
+
+    def send(self, recipient: str, title: str, message: str) -> DeliveryResult:
+        """Deliver one message, retrying transient failures."""
+        fields = {"token": self.token, "user": recipient, "title": title, "message": message}
+        status = None
+        error = None
+        for attempt in range(1, self.retries + 2):
+            try:
+                self._wait_if_paused()
+                status, payload = self._post(fields)
+                if payload.get("status") == 1:
+                    return DeliveryResult(recipient, True, attempt, status, payload.get("request"))
+                errors = payload.get("errors") or [f"HTTP {status}"]
+                return DeliveryResult(recipient, False, attempt, status, payload.get("request"), "; ".join(errors))
+            except _RetryableError as e:
+                status, error = e.status, str(e)
+                if attempt <= self.retries:
+                    cap = self.backoff * 2 ** (attempt - 1) if e.wait is None else e.wait
+                    time.sleep(random.uniform(0, cap))
+            except Exception as e:  # fail this recipient only, not the whole send_many
+                return DeliveryResult(recipient, False, attempt, status, error=f"{type(e).__name__}: {e}")
+        return DeliveryResult(recipient, False, self.retries + 1, status, error=error)
+
+    def send_many(self, jobs) -> list[DeliveryResult]:
+        """Deliver (recipient, title, message) jobs concurrently. Results keep job order."""
+        jobs = list(jobs)
+        if len(jobs) == 1:
+            return [self.send(*jobs[0])]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs)) or 1) as pool:
+            return list(pool.map(lambda job: self.send(*job), jobs))
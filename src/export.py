@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Export check-in history as one row per (date, milestone): whether it was active and
+whether it was checked off, joined with the milestone's phase, title and dates.
+
+Rows are produced by generators and written as they come, so memory stays bounded by a
+single user's progress however long the range or large the cohort. A milestone appears
+on a date if it was active then or was checked off then.
+
+Writes CSV, or Parquet when the output ends in .parquet (needs `pip install pyarrow`;
+rows are written in row groups of ROW_GROUP rows).
+
+Usage:
+    python src/export.py --output history.csv
+    python src/export.py --from 2026-06-01 --to 2026-09-30 --phase summer-2026 --output summer.parquet
+    python src/export.py --manifest cohort.json --output cohort.csv   # users as in tenants.py
+"""
+
+import argparse
+import csv
+import os
+import sys
+from datetime import date, timedelta
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from roadmap import ROADMAP, MilestoneIndex, load_roadmap
+
+COLUMNS = (
+    "user", "date", "milestone_id", "phase", "title",
+    "start", "end", "deadline", "active", "checked", "completed",
+)
+ROW_GROUP = 65_536
+
+
+def iter_rows(progress: dict, milestones: list[dict], first: date, last: date,
+              phases: set[str] | None = None, user: str = "", index: MilestoneIndex | None = None):
+    """Yield one row tuple (in COLUMNS order) per milestone active or checked on each date."""
+    index = index or MilestoneIndex(milestones)
+    by_id = {m["id"]: m for m in milestones}
+    completed_on = {
+        m["id"]: (progress.get(m["id"]) or {}).get("completed_date") for m in milestones
+    }
+    log = progress.get("daily_log") or {}
+
+    def row(m: dict, iso: str, active: bool, checked: bool) -> tuple:
+        done = completed_on[m["id"]]
+        deadline = m.get("deadline")
+        return (
+            user, iso, m["id"], m["phase"], m["title"],
+            m["start"].isoformat(), m["end"].isoformat(), deadline.isoformat() if deadline else "",
+            active, checked, bool(done and done <= iso),
+        )
+
+    day = first
+    while day <= last:
+        iso = day.isoformat()
+        checked = log.get(iso) or ()
+        active_ids = set()
+        for m in index.active_on(day):
+            active_ids.add(m["id"])
+            if phases is None or m["phase"] in phases:
+                yield row(m, iso, True, m["id"] in checked)
+        # Check-ins logged outside a milestone's dates still count as history.
+        for milestone_id in checked:
+            m = by_id.get(milestone_id)
+            if m is not None and milestone_id not in active_ids and (phases is None or m["phase"] in phases):
+                yield row(m, iso, False, True)
+        day += timedelta(days=1)
+
+
+def iter_cohort(manifest: str, first: date | None, last: date, phases: set[str] | None = None):
+    """Rows for every user in a tenants.py manifest, one user's progress in memory at a time.
+
+    With first None, each user's rows start at the first start in that user's roadmap.
+    """
+    import json
+
+    from tenants import load_manifest
+
+    indexes: dict[str, tuple[list[dict], MilestoneIndex]] = {}
+    for tenant in load_manifest(manifest):
+        key = str(tenant.roadmap)
+        if key not in indexes:
+            milestones, _ = load_roadmap(key)
+            indexes[key] = (milestones, MilestoneIndex(milestones))
+        milestones, index = indexes[key]
+        try:
+            with open(tenant.progress) as f:
+                progress = json.load(f)
+        except FileNotFoundError:
+            progress = {}
+        start = first or min((m["start"] for m in milestones), default=last)
+        yield from iter_rows(progress, milestones, start, last, phases, tenant.id, index)
+
+
+def write_csv(rows, out) -> int:
+    writer = csv.writer(out)
+    writer.writerow(COLUMNS)
+    count = 0
+    for count, r in enumerate(rows, 1):
+        writer.writerow(r)
+    return count
+
+
+def write_parquet(rows, path: str) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("Parquet export needs pyarrow: pip install pyarrow")
+
+    day_cols = {"date", "start", "end", "deadline"}
+    bool_cols = {"active", "checked", "completed"}
+    schema = pa.schema([
+        (name, pa.date32() if name in day_cols else pa.bool_() if name in bool_cols else pa.string())
+        for name in COLUMNS
+    ])
+
+    def batch(chunk: list[tuple]) -> "pa.RecordBatch":
+        arrays = []
+        for i, name in enumerate(COLUMNS):
+            values = [r[i] for r in chunk]
+            if name in day_cols:
+                values = [date.fromisoformat(v) if v else None for v in values]
+            arrays.append(pa.array(values, schema.field(name).type))
+        return pa.record_batch(arrays, schema=schema)
+
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        chunk = []
+        for r in rows:
+            chunk.append(r)
+            if len(chunk) == ROW_GROUP:
+                writer.write_batch(batch(chunk))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            writer.write_batch(batch(chunk))
+            count += len(chunk)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export check-in history as rows per date and milestone")
+    parser.add_argument("--from", dest="date_from", type=str, help="First date (default: the roadmap's first start, per user with --manifest)")
+    parser.add_argument("--to", dest="date_to", type=str, help="Last date (default: today)")
+    parser.add_argument("--phase", action="append", help="Only milestones in this phase (repeatable)")
+    parser.add_argument("--manifest", type=str, help="Export every user in a tenants.py manifest or directory")
+    parser.add_argument("--output", type=str, help="CSV or .parquet file (default: CSV on stdout)")
+    args = parser.parse_args()
+
+    first = date.fromisoformat(args.date_from) if args.date_from else None
+    last = date.fromisoformat(args.date_to) if args.date_to else date.today()
+    if first and first > last:
+        parser.error("--from must not be after --to")
+    phases = set(args.phase) if args.phase else None
+
+    if args.manifest:
+        rows = iter_cohort(args.manifest, first, last, phases)
+    else:
+        from progress import load_progress
+        first = first or min(m["start"] for m in ROADMAP)
+        rows = iter_rows(load_progress(), ROADMAP, first, last, phases)
+
+    if args.output and args.output.endswith(".parquet"):
+        count = write_parquet(rows, args.output)
+    elif args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            count = write_csv(rows, out)
+    else:
+        count = write_csv(rows, sys.stdout)
+    print(f"Exported {count} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo forecast of milestone completion dates from the daily_log check-in history.
+
+The model for a milestone with a daily action:
+    - it is finished once it has been checked in on TARGET_PACE of its days, i.e. after
+      ceil(TARGET_PACE * days from start to end) check-ins
+    - its daily check-in rate has a Beta posterior. The days it has been active so far
+      (hits and misses) are added to a prior that is centred on the overall check-in
+      rate and is worth PRIOR_DAYS days
+    - each path draws a rate from that posterior, then draws from the negative binomial
+      distribution how many days it takes to collect the remaining check-ins. Together
+      those two draws are one draw from a beta-negative-binomial distribution, so each
+      milestone's distribution is tabulated once at QUANTILES levels and a path just
+      picks a level
+Milestones without a daily action are dated events, assumed done on their due date.
+Completed milestones finish on their completed_date.
+
+Finishes are clamped to HORIZON_DAYS past the last due date. Paths are sampled
+CHUNK_CELLS (path, milestone) cells at a time, and each chunk adds to per-milestone and
+per-phase on-time counts over all paths: a level below a milestone's due-date level is
+on time, with no table lookup. Expected dates are the median finish over the first
+MEDIAN_PATHS paths, so memory doesn't grow with the number of paths. Results are cached
+in data/.cache/forecast.json, keyed on the date, the roadmap and progress_hash(). Once
+the day's forecast exists, the reminder's at-risk line costs one file read.
+
+Needs numpy (pip install numpy). The reminder imports this module only when
+REMINDER_FORECAST=1, and then adds an AT RISK section.
+
+Usage:
+    python src/forecast.py [--date 2026-10-19] [--paths 20000] [--json]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+from datetime import date
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+
+from progress import DATA_DIR, atomic_write, load_progress, progress_hash
+from roadmap import PHASES, ROADMAP, roadmap_hash
+
+CACHE_FILE = DATA_DIR / ".cache" / "forecast.json"
+PATHS = 20_000
+TARGET_PACE = 5 / 7  # share of a milestone's days that should get a check-in
+PRIOR_DAYS = 14
+HORIZON_DAYS = 365  # finishes later than this past the last due date are counted on that day
+CHUNK_CELLS = 2_000_000  # (path, milestone) cells sampled at a time, which bounds memory
+MEDIAN_PATHS = 1_001  # paths whose finishes are kept for the median dates
+QUANTILES = 1_024  # levels in each milestone's table of finish quantiles
+AT_RISK_BELOW = 0.5
+
+
+def _due(m: dict) -> date:
+    return m.get("deadline") or m["end"]
+
+
+def _quantiles(alpha, beta, remaining, limit):
+    """Misses before the remaining-th check-in at QUANTILES evenly spaced levels, per milestone.
+
+    With the rate drawn from Beta(alpha, beta), the misses follow a beta-negative-binomial
+    distribution. Its CDF is built up to limit, which caps the table, CHUNK_CELLS cells
+    at a time.
+    """
+    count = alpha.size
+    table = np.empty((count, QUANTILES), dtype=np.int32)
+    width = int(limit.max(initial=0)) + 1
+    k = np.arange(width - 1, dtype=float)
+    rows = max(1, CHUNK_CELLS // width)
+    for lo in range(0, count, rows):
+        a, b, r = (x[lo:lo + rows, None].astype(float) for x in (alpha, beta, remaining))
+        logp = np.empty((a.shape[0], width))
+        logp[:, :1] = _lgamma(a + r) + _lgamma(a + b) - _lgamma(a) - _lgamma(a + b + r)
+        step = logp[:, 1:]  # log pmf(k + 1) / pmf(k), built in place to bound memory
+        np.add(r, k, out=step)
+        step *= b + k
+        step /= k + 1
+        step /= a + b + r + k
+        np.log(step, out=step)
+        cdf = np.cumsum(logp, axis=1, out=logp)
+        np.exp(cdf, out=cdf)
+        np.cumsum(cdf, axis=1, out=cdf)
+        # Level j is reached at the first k where cdf >= (j + 0.5) / QUANTILES, so its
+        # quantile is the number of k whose cdf reaches fewer than j + 1 levels.
+        cdf *= QUANTILES
+        cdf += 0.5
+        reached = np.minimum(cdf, QUANTILES, out=cdf).astype(np.int64)
+        reached += np.arange(a.shape[0])[:, None] * (QUANTILES + 1)
+        counts = np.bincount(reached.ravel(), minlength=a.shape[0] * (QUANTILES + 1))
+        table[lo:lo + rows] = np.cumsum(counts.reshape(-1, QUANTILES + 1), axis=1)[:, :QUANTILES]
+    return np.minimum(table, limit[:, None])
+
+
+def _lgamma(x):
+    return np.array([math.lgamma(v) for v in x.ravel()]).reshape(x.shape)
+
+
+def _median(kept):
+    """Median of each row of a (rows, samples) array."""
+    if not kept.shape[0]:
+        return np.zeros(0, dtype=np.int64)
+    middle = kept.shape[1] // 2
+    return np.partition(kept, middle, axis=1)[:, middle].astype(np.int64)
+
+
+def simulate(progress: dict, today: date, milestones: list[dict] | None = None,
+             phases: dict | None = None, paths: int = PATHS, seed: int | None = None) -> dict:
+    """Forecast every milestone and phase; see the module docstring for the model."""
+    milestones = ROADMAP if milestones is None else milestones
+    phases = PHASES if phases is None else phases
+    t = today.toordinal()
+    iso_today = today.isoformat()
+
+    # Check-in days before today, per milestone (today's are still to be simulated).
+    checkins: dict[str, list[str]] = {}
+    for day, ids in (progress.get("daily_log") or {}).items():
+        if day < iso_today:
+            for milestone_id in ids:
+                checkins.setdefault(milestone_id, []).append(day)
+
+    count = len(milestones)
+    fixed = np.zeros(count, dtype=np.int64)  # finish ordinal for completed and dated milestones
+    modelled = np.zeros(count, dtype=bool)
+    done = np.zeros(count, dtype=np.int64)
+    observed = np.zeros(count, dtype=np.int64)
+    remaining = np.zeros(count, dtype=np.int64)
+    first_day = np.zeros(count, dtype=np.int64)
+    for i, m in enumerate(milestones):
+        entry = progress.get(m["id"]) or {}
+        if entry.get("completed"):
+            completed_date = entry.get("completed_date")
+            fixed[i] = date.fromisoformat(completed_date).toordinal() if completed_date else t
+        elif not m.get("daily_action"):
+            fixed[i] = max(_due(m).toordinal(), t)
+        else:
+            start, end = m["start"].toordinal(), m["end"].toordinal()
+            days = checkins.get(m["id"], [])
+            target = math.ceil(TARGET_PACE * (end - start + 1))
+            modelled[i] = True
+            done[i] = len(days)
+            observed[i] = min(max(t - start, 0), end - start + 1)
+            remaining[i] = max(target - len(days), 0)
+            first_day[i] = max(t, start)
+            if not remaining[i]:  # already reached: finished on the target-th check-in
+                fixed[i] = date.fromisoformat(sorted(days)[target - 1]).toordinal()
+
+    ahead = modelled & (remaining > 0)
+
+    seen = int(observed[modelled].sum())
+    rate = min(done[modelled].sum(), seen) / seen if seen else TARGET_PACE
+    alpha = 1 + rate * PRIOR_DAYS + np.minimum(done, observed)
+    beta = 1 + (1 - rate) * PRIOR_DAYS + np.maximum(observed - done, 0)
+
+    due = np.array([_due(m).toordinal() for m in milestones], dtype=np.int64)
+    horizon = int(due.max(initial=t)) + HORIZON_DAYS
+    groups = [(key, [i for i, m in enumerate(milestones) if m["phase"] == key]) for key in phases]
+    groups = [(key, members) for key, members in groups if members]
+    group_of = np.full(count, len(groups), dtype=np.int64)  # past the last group: no phase
+    for g, (_, members) in enumerate(groups):
+        group_of[members] = g
+
+    # Sampled milestones, ordered by phase so each phase's rows are a run for reduceat.
+    cols = np.flatnonzero(ahead)
+    cols = cols[np.argsort(group_of[cols], kind="stable")]
+    earliest = first_day[cols] + remaining[cols] - 1  # finish with no missed days
+    table = _quantiles(alpha[cols], beta[cols], remaining[cols], np.maximum(horizon - earliest, 0))
+    phase_end = np.array([phases[key]["end"].toordinal() for key, _ in groups], dtype=np.int64)
+    fixed_ok = np.array([all(fixed[i] <= phase_end[g] for i in members if not ahead[i])
+                         for g, (_, members) in enumerate(groups)], dtype=bool)
+
+    # A path draws a quantile level per milestone; it finishes in time when the level is
+    # below the number of levels whose finish is on or before the due date (or phase end).
+    due_levels = np.count_nonzero(earliest[:, None] + table <= due[cols, None], axis=1).astype(np.uint16)
+    in_phase = int(np.count_nonzero(group_of[cols] < len(groups)))
+    sampled_groups, starts = np.unique(group_of[cols[:in_phase]], return_index=True)
+    end_levels = np.count_nonzero(
+        earliest[:in_phase, None] + table[:in_phase] <= phase_end[group_of[cols[:in_phase]], None], axis=1).astype(np.uint16)
+
+    # On-time hits count every path; medians come from the first MEDIAN_PATHS paths,
+    # kept as finish ordinals.
+    hits = np.zeros(cols.size, dtype=np.int64)
+    phase_hits = np.zeros(len(groups), dtype=np.int64)
+    sample = min(paths, MEDIAN_PATHS)
+    kept = np.empty((cols.size, sample), dtype=np.int32)
+    rng = np.random.default_rng(seed)
+    rows = max(1, CHUNK_CELLS // max(cols.size, 1))
+    for lo in range(0, paths, rows):
+        n = min(rows, paths - lo)
+        level = rng.integers(0, QUANTILES, size=(cols.size, n), dtype=np.uint16)
+        hits += np.count_nonzero(level < due_levels[:, None], axis=1)
+        on_time = np.ones((len(groups), n), dtype=bool)
+        if in_phase:
+            on_time[sampled_groups] = np.logical_and.reduceat(level[:in_phase] < end_levels[:, None], starts, axis=0)
+        phase_hits += np.count_nonzero(on_time & fixed_ok[:, None], axis=1)
+        if lo < sample:
+            part = level[:, :sample - lo]
+            kept[:, lo:lo + part.shape[1]] = earliest[:, None] + np.take_along_axis(table, part, axis=1)
+
+    finish = np.repeat(fixed[:, None].astype(np.int32), sample, axis=1)
+    finish[cols] = kept
+    on_time = (fixed <= due).astype(float)
+    on_time[cols] = hits / paths
+    expected = fixed.copy()
+    expected[cols] = _median(kept)
+    phase_expected = np.zeros(0, dtype=np.int64)
+    if groups:
+        order = [i for _, members in groups for i in members]
+        group_starts = np.cumsum([0] + [len(members) for _, members in groups[:-1]])
+        phase_expected = _median(np.maximum.reduceat(finish[order], group_starts, axis=0))
+
+    result = {"date": iso_today, "paths": paths, "milestones": {}, "phases": {}}
+    for i, m in enumerate(milestones):
+        result["milestones"][m["id"]] = {
+            "phase": m["phase"],
+            "due": _due(m).isoformat(),
+            "expected": date.fromordinal(int(expected[i])).isoformat(),
+            "p_on_time": round(float(on_time[i]), 4) if modelled[i] else None,
+        }
+    for g, (key, members) in enumerate(groups):
+        result["phases"][key] = {
+            "expected": date.fromordinal(int(phase_expected[g])).isoformat(),
+            "p_on_time": round(float(phase_hits[g] / paths), 4),
+        }
+    return result
+
+
+def forecast(today: date, progress: dict | None = None, paths: int = PATHS) -> dict:
+    """simulate() for today, cached per (date, roadmap, progress_hash(), paths)."""
+    key = f"{today.isoformat()}|{roadmap_hash()}|{progress_hash()}|{paths}"
+    try:
+        with open(CACHE_FILE) as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return cached["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    # Seeded from the key, so a rerun on unchanged data reproduces the cached numbers.
+    seed = int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+    result = simulate(load_progress() if progress is None else progress, today, paths=paths, seed=seed)
+    atomic_write(CACHE_FILE, json.dumps({"key": key, "result": result}, separators=(",", ":")) + "\n")
+    return result
+
+
+def at_risk(result: dict, milestones, threshold: float = AT_RISK_BELOW) -> list[tuple[dict, float]]:
+    """(milestone, on-time probability) for those of milestones below threshold, riskiest first."""
+    risky = []
+    for m in milestones:
+        p = result["milestones"].get(m["id"], {}).get("p_on_time")
+        if p is not None and p < threshold:
+            risky.append((m, p))
+    risky.sort(key=lambda pair: pair[1])
+    return risky
+
+
+def format_forecast(result: dict) -> str:
+    lines = [f"Forecast for {result['date']} ({result['paths']:,} paths)", "", "Phases:"]
+    for key, f in result["phases"].items():
+        lines.append(f"  {PHASES.get(key, {}).get('label', key):<28} expected {f['expected']}  on time {f['p_on_time']:.0%}")
+    lines += ["", "Milestones (due, expected, on time):"]
+    by_id = {m["id"]: m for m in ROADMAP}
+    for milestone_id, f in result["milestones"].items():
+        p = "  --" if f["p_on_time"] is None else f"{f['p_on_time']:4.0%}"
+        lines.append(f"  {f['due']}  {f['expected']}  {p}  {by_id[milestone_id]['title'][:60]}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo forecast of milestone and phase completion")
+    parser.add_argument("--date", type=str, help="Forecast from this date (YYYY-MM-DD); default today")
+    parser.add_argument("--paths", type=int, default=PATHS, help=f"Simulated paths (default {PATHS:,})")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args()
+
+    today = date.fromisoformat(args.date) if args.date else date.today()
+    result = forecast(today, paths=args.paths)
+    print(json.dumps(result, indent=2) if args.json else format_forecast(result))
+
+
+if __name__ == "__main__":
+    main()
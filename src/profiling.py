@@ -0,0 +1,101 @@
+"""
+Per-stage wall-clock timings for a reminder run, emitted as one JSON line on stderr.
+
+Disabled runs get NULL_PROFILER, whose stage() hands back a shared no-op context, so the
+instrumented code costs a method call per stage and nothing else.
+"""
+
+import sys
+import time
+
+
+class _Stage:
+    __slots__ = ("_profiler", "_name", "_t0")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self._t0) * 1000
+        stages = self._profiler.stages
+        stages[self._name] = stages.get(self._name, 0.0) + elapsed
+        return False
+
+
+class Profiler:
+    """Accumulates stage timings (ms) and counters, optionally under cProfile."""
+
+    enabled = True
+
+    def __init__(self, cprofile_path: str | None = None):
+        self.stages: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.info: dict[str, str] = {}
+        self._started = time.perf_counter()
+        self._cprofile_path = cprofile_path
+        self._cprofile = None
+        if cprofile_path:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stage(self, name: str) -> _Stage:
+        """Context manager adding the block's wall time to stage name."""
+        return _Stage(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def emit(self, stream=None) -> None:
+        """Stop profiling and write the JSON line (and the cProfile dump, if requested)."""
+        import json
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self._cprofile_path)
+        record = {
+            "event": "reminder_profile",
+            **self.info,
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "stages": {name: round(ms, 3) for name, ms in self.stages.items()},
+            "counts": self.counts,
+        }
+        if self._cprofile_path:
+            record["cprofile"] = self._cprofile_path
+        print(json.dumps(record), file=stream or sys.stderr)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _NullProfiler:
+    enabled = False
+    _stage = _NullStage()
+
+    @property
+    def info(self) -> dict:
+        return {}  # a fresh dict each time, so writes are simply dropped
+
+    def stage(self, name: str) -> _NullStage:
+        return self._stage
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def emit(self, stream=None) -> None:
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
@@ -1,15 +1,52 @@
 """
 Read/write progress.json — tracks completion state for each milestone.
+
+Set PROGRESS_BACKEND to keep progress somewhere other than progress.json:
+    log     append-only event log (progress_log.py)
+    sqlite  indexed SQLite database (progress_db.py)
+    sharded milestone state plus month-sharded, lazily loaded daily_log (progress_shards.py)
+The functions here return the same dict shape whichever backend is in use. Alternative
+backends are modules exposing load(), save(progress), complete(id, day) and
+check(id, day, checked).
+
+load_progress() returns a Progress: a dict that also carries completion counters
+(ProgressStats) and a completion-date index (CompletionIndex), so get_stats(),
+phase_stats() and windowed completion queries don't rescan the roadmap.
+
+progress.json carries a schema_version. Loads never rewrite the file; migrate_file() (or
+`python progress.py migrate`) brings an older one to SCHEMA_VERSION: entries for milestones
+not in ROADMAP and their check-ins move to progress_archive.json, empty daily_log days are
+dropped, and the file is rewritten as compact JSON. Run it against the roadmap the file
+belongs to, since under another ROADMAP_FILE real entries would be archived.
+
+Usage:
+    python progress.py migrate   # Migrate progress.json against ROADMAP_FILE
 """
 
-import json
+import _thread  # not threading: this module is on the reminder's cold path
+import os
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None
+
 from roadmap import ROADMAP
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 PROGRESS_FILE = DATA_DIR / "progress.json"
+LOCK_FILE = DATA_DIR / ".progress.lock"
+ARCHIVE_FILE = DATA_DIR / "progress_archive.json"
+SCHEMA_VERSION = 2  # 1: unversioned, indented; 2: orphans archived, compact
+RESERVED_KEYS = ("daily_log", "schema_version")
+
+_lock_depth = 0
+_thread_lock = _thread.RLock()
+_roadmap_ids: tuple | None = None  # (ROADMAP, {milestone id: (position, phase key)})
 
 
 def _default_progress() -> dict:
@@ -20,15 +57,226 @@ def _default_progress() -> dict:
     }
 
 
+def _store():
+    """Return the configured backend module, or None for plain progress.json."""
+    backend = os.getenv("PROGRESS_BACKEND", "json")
+    if backend == "json":
+        return None
+    if backend == "log":
+        import progress_log
+        return progress_log
+    if backend == "sqlite":
+        import progress_db
+        return progress_db
+    if backend == "sharded":
+        import progress_shards
+        return progress_shards
+    raise ValueError(f"Unknown PROGRESS_BACKEND: {backend!r}")
+
+
+def _milestone_ids() -> dict[str, tuple[int, str]]:
+    """Milestone id -> (position, phase key) for ROADMAP, rebuilt if the list was replaced or resized."""
+    global _roadmap_ids
+    if _roadmap_ids is None or _roadmap_ids[0] is not ROADMAP or len(_roadmap_ids[1]) != len(ROADMAP):
+        _roadmap_ids = (ROADMAP, {m["id"]: (i, m["phase"]) for i, m in enumerate(ROADMAP)})
+    return _roadmap_ids[1]
+
+
+def _done(entry) -> bool:
+    return bool(entry and entry.get("completed", False))
+
+
+class ProgressStats:
+    """Completed/total counters for one progress dict, overall and per phase.
+
+    Built with one pass over the roadmap, then adjusted in O(1) as entries change.
+    """
+
+    __slots__ = ("roadmap", "total", "completed", "phases")
+
+    def __init__(self, progress: dict):
+        self.roadmap = ROADMAP
+        self.total = len(ROADMAP)
+        self.completed = 0
+        self.phases: dict[str, list[int]] = {}  # phase -> [completed, total]
+        for m in ROADMAP:
+            counts = self.phases.setdefault(m["phase"], [0, 0])
+            counts[1] += 1
+            if _done(progress.get(m["id"])):
+                counts[0] += 1
+                self.completed += 1
+
+    def apply(self, milestone_id: str, was_done: bool, now_done: bool) -> None:
+        if was_done == now_done:
+            return
+        found = _milestone_ids().get(milestone_id)
+        if found is None:
+            return  # not on the roadmap (an archived id): never counted
+        step = 1 if now_done else -1
+        self.completed += step
+        self.phases[found[1]][0] += step
+
+    def valid(self) -> bool:
+        """Cheap consistency check: same roadmap, and the counters still add up."""
+        return (
+            self.roadmap is ROADMAP
+            and self.total == len(ROADMAP)
+            and 0 <= self.completed <= self.total
+            and sum(done for done, _ in self.phases.values()) == self.completed
+        )
+
+
+class CompletionIndex:
+    """Milestones that have a completed_date, sorted by it, for [first, last] window queries.
+
+    A window costs O(log n + k) for k completions in it, however long the history.
+    """
+
+    __slots__ = ("milestones", "size", "_keys")
+
+    def __init__(self, progress: dict, milestones: list[dict] | None = None):
+        self.milestones = ROADMAP if milestones is None else milestones
+        self.size = len(self.milestones)
+        keys = []
+        for i, m in enumerate(self.milestones):
+            cd = (progress.get(m["id"]) or {}).get("completed_date")
+            if cd:
+                keys.append((cd, i))
+        keys.sort()
+        self._keys = keys  # (completed_date ISO string, roadmap position)
+
+    def _window(self, first: date, last: date) -> list[tuple[str, int]]:
+        lo = bisect_left(self._keys, (first.isoformat(), -1))
+        hi = bisect_right(self._keys, (last.isoformat(), self.size))
+        return self._keys[lo:hi]
+
+    def between(self, first: date, last: date) -> list[tuple[str, dict]]:
+        """(completed_date, milestone) for completions in [first, last], by date then list order."""
+        return [(cd, self.milestones[i]) for cd, i in self._window(first, last)]
+
+    def milestones_between(self, first: date, last: date) -> list[dict]:
+        """Milestones completed in [first, last], in roadmap order."""
+        return [self.milestones[i] for i in sorted(i for _, i in self._window(first, last))]
+
+    def move(self, position: int, old: str | None, new: str | None) -> None:
+        """Re-file one milestone whose completed_date changed from old to new."""
+        if old:
+            at = bisect_left(self._keys, (old, position))
+            if at < len(self._keys) and self._keys[at] == (old, position):
+                del self._keys[at]
+        if new:
+            insort(self._keys, (new, position))
+
+    def valid(self) -> bool:
+        return self.milestones is ROADMAP and self.size == len(ROADMAP)
+
+
+def _completed_date(entry) -> str | None:
+    return entry.get("completed_date") if entry else None
+
+
+class Progress(dict):
+    """A progress dict whose counters and completion index follow every entry change.
+
+    Change milestones by assigning whole entries (progress[id] = {...}), through
+    set_completed() or with any dict method (update, pop, setdefault, ...); editing an
+    entry in place bypasses both.
+    """
+
+    __slots__ = ("_stats", "_completions")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats = None
+        self._completions = None
+
+    @property
+    def stats(self) -> ProgressStats:
+        """Counters, computed on first use and recomputed if they fail validation."""
+        if self._stats is None or not self._stats.valid():
+            self._stats = ProgressStats(self)
+        return self._stats
+
+    @property
+    def completions(self) -> CompletionIndex:
+        """Completion-date index over ROADMAP, built on first use, rebuilt if the roadmap changed."""
+        if self._completions is None or not self._completions.valid():
+            self._completions = CompletionIndex(self)
+        return self._completions
+
+    def _track(self, key, old, new) -> None:
+        # getattr: the slots are still unset while copy/pickle refill the dict.
+        if key in RESERVED_KEYS:
+            return
+        if getattr(self, "_stats", None) is not None:
+            self._stats.apply(key, _done(old), _done(new))
+        index = getattr(self, "_completions", None)
+        if index is not None and _completed_date(old) != _completed_date(new):
+            found = _milestone_ids().get(key)
+            if found is not None and index.valid():
+                index.move(found[0], _completed_date(old), _completed_date(new))
+
+    def __setitem__(self, key, value):
+        self._track(key, self.get(key), value)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._track(key, self.get(key), None)
+        super().__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._track(key, value, None)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._stats = None
+        self._completions = None
+
+
+def set_completed(progress: dict, milestone_id: str, completed: bool = True, day: date | None = None) -> None:
+    """Mark a milestone complete (dated day, default today) or not, keeping stats in step."""
+    progress[milestone_id] = {
+        "completed": completed,
+        "completed_date": (day or date.today()).isoformat() if completed else None,
+    }
+
+
 def load_progress() -> dict:
     """Load progress from file, creating it with defaults if missing."""
-    if not PROGRESS_FILE.exists():
-        progress = _default_progress()
+    import json
+
+    store = _store()
+    if store is not None:
+        saved = store.load()
+    elif not PROGRESS_FILE.exists():
+        progress = Progress(_default_progress(), schema_version=SCHEMA_VERSION)
         save_progress(progress)
         return progress
-
-    with open(PROGRESS_FILE) as f:
-        saved = json.load(f)
+    else:
+        with open(PROGRESS_FILE) as f:
+            saved = json.load(f)
 
     # Merge with defaults so new milestones get added automatically
     defaults = _default_progress()
@@ -36,24 +284,187 @@ def load_progress() -> dict:
         if key not in saved:
             saved[key] = val
 
-    return saved
+    return Progress(saved)
 
 
 def save_progress(progress: dict) -> None:
     """Write progress to file."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump(progress, f, indent=2)
-        f.write("\n")
+    import json
+
+    store = _store()
+    if store is not None:
+        store.save(progress)
+        return
+    atomic_write(PROGRESS_FILE, json.dumps(progress, separators=(",", ":")) + "\n")
+
+
+def migrate(progress: dict) -> dict:
+    """Bring a progress dict to SCHEMA_VERSION in place; returns what was archived.
+
+    Milestone entries not in ROADMAP, and their daily_log check-ins, are removed and
+    returned as {"milestones": {...}, "daily_log": {...}}. Days left with no check-ins
+    are dropped.
+    """
+    known = _milestone_ids()
+    archived: dict = {"milestones": {}, "daily_log": {}}
+    for key in [k for k in progress if k not in RESERVED_KEYS and k not in known]:
+        archived["milestones"][key] = progress.pop(key)
+    log = progress.get("daily_log") or {}
+    for day in list(log):
+        ids = log[day] or []
+        orphans = [i for i in ids if i not in known]
+        if orphans:
+            archived["daily_log"][day] = orphans
+        kept = [i for i in ids if i in known]
+        if kept:
+            log[day] = kept
+        else:
+            del log[day]
+    progress["schema_version"] = SCHEMA_VERSION
+    return archived
+
+
+def migrate_file() -> dict:
+    """Migrate progress.json under the lock, archiving what migrate() removes; returns that.
+
+    Files already at SCHEMA_VERSION are left alone.
+    """
+    import json
+
+    with progress_lock():
+        with open(PROGRESS_FILE) as f:
+            saved = json.load(f)
+        if saved.get("schema_version") == SCHEMA_VERSION:
+            return {"milestones": {}, "daily_log": {}}
+        archived = migrate(saved)
+        if archived["milestones"] or archived["daily_log"]:
+            archive = {"milestones": {}, "daily_log": {}}
+            if ARCHIVE_FILE.exists():
+                with open(ARCHIVE_FILE) as f:
+                    archive = json.load(f)
+            archive["milestones"].update(archived["milestones"])
+            for day, ids in archived["daily_log"].items():
+                archive["daily_log"].setdefault(day, [])
+                archive["daily_log"][day] += [i for i in ids if i not in archive["daily_log"][day]]
+            atomic_write(ARCHIVE_FILE, json.dumps(archive, indent=2, sort_keys=True) + "\n")
+        save_progress(saved)
+        return archived
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Write via a temp file and rename, so readers never see a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+@contextmanager
+def progress_lock():
+    """Hold the advisory lock on the progress store. Re-entrant within a process."""
+    global _lock_depth
+    with _thread_lock:
+        _lock_depth += 1
+        try:
+            if _lock_depth > 1 or fcntl is None:
+                yield
+            else:
+                DATA_DIR.mkdir(parents=True, exist_ok=True)
+                with open(LOCK_FILE, "a") as lock:
+                    fcntl.flock(lock, fcntl.LOCK_EX)  # released when the file is closed
+                    yield
+        finally:
+            _lock_depth -= 1
+
+
+@contextmanager
+def mutate_progress():
+    """Load progress under the lock, let the caller edit it, then save it once.
+
+    Nothing is written if the block raises.
+
+        with mutate_progress() as progress:
+            progress["daily_log"].setdefault("2026-03-02", []).append("calc3")
+    """
+    with progress_lock():
+        progress = load_progress()
+        yield progress
+        save_progress(progress)
+
+
+def mark_many(milestone_ids, day: date | None = None) -> int:
+    """Mark several milestones complete in one load/save. Returns how many were marked."""
+    marked = 0
+    with mutate_progress() as progress:
+        for milestone_id in milestone_ids:
+            if milestone_id in progress and milestone_id not in RESERVED_KEYS:
+                set_completed(progress, milestone_id, True, day)
+                marked += 1
+    return marked
 
 
 def mark_complete(milestone_id: str) -> None:
     """Mark a milestone as completed with today's date."""
-    progress = load_progress()
-    if milestone_id in progress:
-        progress[milestone_id]["completed"] = True
-        progress[milestone_id]["completed_date"] = date.today().isoformat()
-        save_progress(progress)
+    store = _store()
+    if store is not None:
+        if any(m["id"] == milestone_id for m in ROADMAP):
+            store.complete(milestone_id, date.today())
+        return
+    mark_many([milestone_id])
+
+
+def check_in(milestone_id: str, day: date | None = None, checked: bool = True) -> None:
+    """Tick (or untick) a milestone's daily action in daily_log."""
+    day = day or date.today()
+    store = _store()
+    if store is not None:
+        store.check(milestone_id, day, checked)
+        return
+    with mutate_progress() as progress:
+        entries = progress.setdefault("daily_log", {}).setdefault(day.isoformat(), [])
+        if checked and milestone_id not in entries:
+            entries.append(milestone_id)
+        elif not checked and milestone_id in entries:
+            entries.remove(milestone_id)
+
+
+def store_files() -> list[Path]:
+    """The files the configured backend keeps progress in."""
+    store = _store()
+    if store is None:
+        return [PROGRESS_FILE]
+    if store.__name__ == "progress_log":
+        return [store.SNAPSHOT_FILE, store.LOG_FILE]
+    if store.__name__ == "progress_db":
+        return [store.DB_FILE]
+    return sorted(store.SHARD_DIR.rglob("*.json"))
+
+
+def progress_hash() -> str:
+    """SHA-256 of the stored progress state; changes whenever progress does."""
+    import hashlib
+
+    if _store() is None:
+        if not PROGRESS_FILE.exists():
+            load_progress()  # writes the defaults
+        return hashlib.sha256(PROGRESS_FILE.read_bytes()).hexdigest()
+    # Other backends spread state over several files, some of them large (month shards,
+    # the database). Hash each file's version, not its contents, so nothing is read.
+    digest = hashlib.sha256()
+    for path in store_files():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return digest.hexdigest()
 
 
 def is_completed(progress: dict, milestone_id: str) -> bool:
@@ -67,8 +478,42 @@ def get_completed_date(progress: dict, milestone_id: str) -> date | None:
     return None
 
 
+def _stats_for(progress: dict) -> ProgressStats:
+    if isinstance(progress, Progress):
+        return progress.stats
+    return ProgressStats(progress)  # a plain dict carries no counters: count it once
+
+
 def get_stats(progress: dict) -> tuple[int, int]:
     """Return (completed_count, total_count)."""
-    total = len(ROADMAP)
-    completed = sum(1 for m in ROADMAP if is_completed(progress, m["id"]))
-    return completed, total
+    stats = _stats_for(progress)
+    return stats.completed, stats.total
+
+
+def completion_index(progress: dict) -> CompletionIndex:
+    """The completion-date index for progress: kept up to date on a Progress, built for a plain dict."""
+    if isinstance(progress, Progress):
+        return progress.completions
+    return CompletionIndex(progress)
+
+
+def phase_stats(progress: dict) -> dict[str, tuple[int, int]]:
+    """Return {phase key: (completed_count, total_count)} in roadmap order."""
+    return {key: (done, total) for key, (done, total) in _stats_for(progress).phases.items()}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Progress store maintenance")
+    parser.add_argument("command", choices=["migrate"])
+    parser.parse_args()
+    if _store() is not None:
+        raise SystemExit("migrate applies to the plain progress.json store only")
+    archived = migrate_file()
+    print(f"{PROGRESS_FILE.name} is at schema_version {SCHEMA_VERSION}; archived "
+          f"{len(archived['milestones'])} milestone(s) and check-ins from {len(archived['daily_log'])} day(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+SQLite backend for progress, with indexed milestone state and daily check-ins.
+
+Enable it with PROGRESS_BACKEND=sqlite. Besides the load/save interface progress.py
+expects, it answers history questions ("completions in the last 7 days", "check-ins
+for X this quarter") with index lookups instead of parsing the whole history.
+
+Usage:
+    python progress_db.py import [path/to/progress.json]   # One-shot import into progress.db
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from progress import DATA_DIR, PROGRESS_FILE
+
+DB_FILE = DATA_DIR / "progress.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS milestones (
+    id TEXT PRIMARY KEY,
+    completed INTEGER NOT NULL DEFAULT 0,
+    completed_date TEXT
+);
+CREATE INDEX IF NOT EXISTS milestones_by_completed_date ON milestones (completed_date);
+
+CREATE TABLE IF NOT EXISTS checkins (
+    day TEXT NOT NULL,
+    milestone_id TEXT NOT NULL,
+    PRIMARY KEY (day, milestone_id)
+);
+CREATE INDEX IF NOT EXISTS checkins_by_milestone ON checkins (milestone_id, day);
+"""
+
+
+def connect(path: Path | None = None) -> sqlite3.Connection:
+    """Open the database, creating the schema if needed."""
+    path = path or DB_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+@contextmanager
+def _session():
+    """A connection that commits on success and is always closed."""
+    conn = connect()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _write(conn: sqlite3.Connection, progress: dict) -> None:
+    conn.executemany(
+        "INSERT INTO milestones (id, completed, completed_date) VALUES (?, ?, ?) "
+        "ON CONFLICT (id) DO UPDATE SET completed = excluded.completed, completed_date = excluded.completed_date",
+        [
+            (key, int(bool(entry.get("completed"))), entry.get("completed_date"))
+            for key, entry in progress.items()
+            if key != "daily_log" and isinstance(entry, dict)
+        ],
+    )
+    conn.execute("DELETE FROM checkins")
+    conn.executemany(
+        "INSERT OR IGNORE INTO checkins (day, milestone_id) VALUES (?, ?)",
+        [(day, mid) for day, ids in progress.get("daily_log", {}).items() for mid in ids],
+    )
+
+
+def load() -> dict:
+    """Rebuild the progress dict. Days with no check-ins are not stored, so they don't come back."""
+    with _session() as conn:
+        progress = {
+            mid: {"completed": bool(completed), "completed_date": completed_date}
+            for mid, completed, completed_date in conn.execute("SELECT id, completed, completed_date FROM milestones")
+        }
+        daily_log = {}
+        # rowid order preserves the order check-ins were recorded within a day
+        for day, mid in conn.execute("SELECT day, milestone_id FROM checkins ORDER BY day, rowid"):
+            daily_log.setdefault(day, []).append(mid)
+    if daily_log:
+        progress["daily_log"] = daily_log
+    return progress
+
+
+def save(progress: dict) -> None:
+    """Replace the stored state with progress in one transaction."""
+    with _session() as conn:
+        _write(conn, progress)
+
+
+def complete(milestone_id: str, day: date) -> None:
+    with _session() as conn:
+        conn.execute(
+            "INSERT INTO milestones (id, completed, completed_date) VALUES (?, 1, ?) "
+            "ON CONFLICT (id) DO UPDATE SET completed = 1, completed_date = excluded.completed_date",
+            (milestone_id, day.isoformat()),
+        )
+
+
+def check(milestone_id: str, day: date, checked: bool = True) -> None:
+    with _session() as conn:
+        if checked:
+            conn.execute("INSERT OR IGNORE INTO checkins (day, milestone_id) VALUES (?, ?)", (day.isoformat(), milestone_id))
+        else:
+            conn.execute("DELETE FROM checkins WHERE day = ? AND milestone_id = ?", (day.isoformat(), milestone_id))
+
+
+def completions_between(first: date, last: date) -> list[tuple[str, str]]:
+    """(milestone_id, completed_date) for completions in [first, last], oldest first."""
+    with _session() as conn:
+        return conn.execute(
+            "SELECT id, completed_date FROM milestones "
+            "WHERE completed = 1 AND completed_date BETWEEN ? AND ? ORDER BY completed_date, id",
+            (first.isoformat(), last.isoformat()),
+        ).fetchall()
+
+
+def checkins_for(milestone_id: str, first: date, last: date) -> list[str]:
+    """Days in [first, last] on which milestone_id was checked in."""
+    with _session() as conn:
+        rows = conn.execute(
+            "SELECT day FROM checkins WHERE milestone_id = ? AND day BETWEEN ? AND ? ORDER BY day",
+            (milestone_id, first.isoformat(), last.isoformat()),
+        )
+        return [day for (day,) in rows]
+
+
+def checkins_on(first: date, last: date) -> dict[str, list[str]]:
+    """daily_log restricted to [first, last]."""
+    with _session() as conn:
+        rows = conn.execute(
+            "SELECT day, milestone_id FROM checkins WHERE day BETWEEN ? AND ? ORDER BY day, rowid",
+            (first.isoformat(), last.isoformat()),
+        )
+        log = {}
+        for day, mid in rows:
+            log.setdefault(day, []).append(mid)
+        return log
+
+
+def import_json(source: Path) -> tuple[int, int]:
+    """Load a progress.json into the database. Returns (milestones, check-ins) imported."""
+    with open(source) as f:
+        progress = json.load(f)
+    with _session() as conn:
+        _write(conn, progress)
+        milestones = conn.execute("SELECT COUNT(*) FROM milestones").fetchone()[0]
+        checkins = conn.execute("SELECT COUNT(*) FROM checkins").fetchone()[0]
+    return milestones, checkins
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite progress store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="Import a progress.json into the database")
+    imp.add_argument("source", nargs="?", default=str(PROGRESS_FILE))
+    args = parser.parse_args()
+
+    milestones, checkins = import_json(Path(args.source))
+    print(f"Imported {milestones} milestones and {checkins} check-ins into {DB_FILE}")
+
+
+if __name__ == "__main__":
+    main()
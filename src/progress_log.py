@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Append-only event log backend for progress.
+
+State is the latest compacted snapshot plus a replay of the events appended after it.
+Completions and daily check-ins are single appended lines, so writes cost the same no
+matter how much history exists. Enable it with PROGRESS_BACKEND=log.
+
+Usage:
+    python progress_log.py compact   # Fold the log into a fresh snapshot
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from progress import DATA_DIR, PROGRESS_FILE, atomic_write, progress_lock
+
+SNAPSHOT_FILE = DATA_DIR / "progress.snapshot.json"
+LOG_FILE = DATA_DIR / "progress.log.jsonl"
+
+_UNTOUCHED = {"completed": False, "completed_date": None}
+
+# The state save() last replayed or wrote, and the file stamps it matches.
+_replayed = {"stamp": None, "state": None}
+
+
+def _apply(state: dict, event: dict) -> None:
+    """Apply one event to state. Every op is a set, so replaying twice is harmless."""
+    op = event["op"]
+    if op == "complete":
+        state[event["id"]] = {"completed": True, "completed_date": event.get("date")}
+    elif op == "uncomplete":
+        state[event["id"]] = {"completed": False, "completed_date": None}
+    elif op == "check":
+        day = state.setdefault("daily_log", {}).setdefault(event["date"], [])
+        if event["id"] not in day:
+            day.append(event["id"])
+    elif op == "uncheck":
+        day = state.get("daily_log", {}).get(event["date"], [])
+        if event["id"] in day:
+            day.remove(event["id"])
+    else:
+        raise ValueError(f"Unknown progress event: {op!r}")
+
+
+def _read_snapshot() -> dict:
+    # The first run seeds from the plain progress.json so switching backends keeps history.
+    for path in (SNAPSHOT_FILE, PROGRESS_FILE):
+        if path.exists():
+            with open(path) as f:
+                return json.load(f)
+    return {}
+
+
+def load() -> dict:
+    """Rebuild state from the snapshot and the log tail."""
+    state = _read_snapshot()
+    if LOG_FILE.exists():
+        with open(LOG_FILE) as f:
+            for line in f:
+                if line.strip():
+                    _apply(state, json.loads(line))
+    return state
+
+
+def _stamp() -> tuple:
+    """(path, size, mtime) of every file load() reads; any write by anyone changes it."""
+    stamps = []
+    for path in (SNAPSHOT_FILE, PROGRESS_FILE, LOG_FILE):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            stamps.append((str(path), None, None))
+        else:
+            stamps.append((str(path), st.st_size, st.st_mtime_ns))
+    return tuple(stamps)
+
+
+def _current() -> dict:
+    """State as of the files on disk, replaying the log only if it changed since last time."""
+    stamp = _stamp()
+    if _replayed["stamp"] != stamp:
+        _replayed["state"], _replayed["stamp"] = load(), stamp
+    return _replayed["state"]
+
+
+def append(*events: dict) -> None:
+    """Append events to the log."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    with progress_lock(), open(LOG_FILE, "a") as f:
+        f.write("".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events))
+
+
+def complete(milestone_id: str, day: date) -> None:
+    append({"op": "complete", "id": milestone_id, "date": day.isoformat()})
+
+
+def check(milestone_id: str, day: date, checked: bool = True) -> None:
+    append({"op": "check" if checked else "uncheck", "id": milestone_id, "date": day.isoformat()})
+
+
+def diff(old: dict, new: dict) -> list[dict]:
+    """Events that turn old into new."""
+    events = []
+    for key, entry in new.items():
+        if key == "daily_log" or not isinstance(entry, dict):
+            continue
+        before = old.get(key, _UNTOUCHED)
+        if entry.get("completed") == before.get("completed") and entry.get("completed_date") == before.get("completed_date"):
+            continue
+        if entry.get("completed"):
+            events.append({"op": "complete", "id": key, "date": entry.get("completed_date")})
+        else:
+            events.append({"op": "uncomplete", "id": key})
+
+    old_log, new_log = old.get("daily_log", {}), new.get("daily_log", {})
+    for day in sorted(set(old_log) | set(new_log)):
+        was, now = old_log.get(day, []), new_log.get(day, [])
+        events += [{"op": "uncheck", "id": mid, "date": day} for mid in was if mid not in now]
+        events += [{"op": "check", "id": mid, "date": day} for mid in now if mid not in was]
+    return events
+
+
+def save(progress: dict) -> None:
+    """Persist a whole progress dict by appending only what changed."""
+    with progress_lock():
+        state = _current()
+        events = diff(state, progress)
+        if events:
+            append(*events)
+            for event in events:
+                _apply(state, event)
+            _replayed["stamp"] = _stamp()
+
+
+def compact() -> int:
+    """Write the current state as the new snapshot and empty the log. Returns events folded."""
+    with progress_lock():
+        folded = 0
+        if LOG_FILE.exists():
+            with open(LOG_FILE) as f:
+                folded = sum(1 for line in f if line.strip())
+        state = load()
+        atomic_write(SNAPSHOT_FILE, json.dumps(state, separators=(",", ":")) + "\n")
+        # A crash before this truncate only means replaying events the snapshot already has.
+        open(LOG_FILE, "w").close()
+    return folded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Progress event log maintenance")
+    parser.add_argument("command", choices=["compact"])
+    parser.parse_args()
+    folded = compact()
+    print(f"Compacted {folded} events into {SNAPSHOT_FILE.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Month-sharded progress backend: milestone state in one small file, daily_log split by month.
+
+Enable it with PROGRESS_BACKEND=sharded. Layout under data/progress/:
+    milestones.json     completion state, loaded eagerly
+    manifest.json       which months have check-ins
+    log/YYYY-MM.json    one shard per month, loaded only when a date in it is touched
+Writes only rewrite the shards that actually changed.
+
+Usage:
+    python progress_shards.py split [path/to/progress.json]   # Shard an existing file
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections.abc import MutableMapping
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from progress import DATA_DIR, PROGRESS_FILE, atomic_write, progress_lock
+
+SHARD_DIR = DATA_DIR / "progress"
+
+
+def _dump(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True)
+
+
+class ShardedLog(MutableMapping):
+    """daily_log as a mapping of "YYYY-MM-DD" -> [ids] whose month shards load on first use."""
+
+    def __init__(self, root: Path | None = None):
+        self._root = root or SHARD_DIR
+        self._manifest: dict | None = None
+        self._shards: dict[str, dict] = {}
+        self._as_loaded: dict[str, str] = {}
+
+    @property
+    def manifest(self) -> dict:
+        if self._manifest is None:
+            path = self._root / "manifest.json"
+            self._manifest = json.loads(path.read_text()) if path.exists() else {"months": {}}
+        return self._manifest
+
+    def _shard(self, month: str) -> dict:
+        if month not in self._shards:
+            path = self._root / "log" / f"{month}.json"
+            text = path.read_text() if path.exists() else "{}"
+            self._shards[month] = json.loads(text)
+            self._as_loaded[month] = _dump(self._shards[month])
+        return self._shards[month]
+
+    def _months(self) -> list[str]:
+        return sorted(set(self.manifest["months"]) | set(self._shards))
+
+    def __getitem__(self, day: str) -> list:
+        return self._shard(day[:7])[day]
+
+    def __setitem__(self, day: str, ids: list) -> None:
+        self._shard(day[:7])[day] = ids
+
+    def __delitem__(self, day: str) -> None:
+        del self._shard(day[:7])[day]
+
+    def __iter__(self):
+        for month in self._months():
+            yield from sorted(self._shard(month))
+
+    def __len__(self) -> int:
+        return sum(len(self._shard(month)) for month in self._months())
+
+    def between(self, first: date, last: date) -> dict:
+        """Check-ins for days in [first, last], loading only the months that overlap."""
+        lo, hi = first.isoformat(), last.isoformat()
+        found = {}
+        for month in self._months():
+            if lo[:7] <= month <= hi[:7]:
+                found.update((day, ids) for day, ids in self._shard(month).items() if lo <= day <= hi)
+        return dict(sorted(found.items()))
+
+    def loaded_months(self) -> list[str]:
+        return sorted(self._shards)
+
+    def flush(self) -> list[str]:
+        """Write every loaded shard that changed since it was read. Returns the months written."""
+        written = []
+        for month, shard in self._shards.items():
+            text = _dump(shard)
+            if text == self._as_loaded[month]:
+                continue
+            path = self._root / "log" / f"{month}.json"
+            if shard:
+                atomic_write(path, text + "\n")
+                self.manifest["months"][month] = len(shard)
+            else:
+                path.unlink(missing_ok=True)
+                self.manifest["months"].pop(month, None)
+            self._as_loaded[month] = text
+            written.append(month)
+        if written:
+            atomic_write(self._root / "manifest.json", _dump(self.manifest) + "\n")
+        return written
+
+
+def _read_milestones(root: Path) -> dict:
+    path = root / "milestones.json"
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _write_milestones(root: Path, milestones: dict) -> None:
+    atomic_write(root / "milestones.json", _dump(milestones) + "\n")
+
+
+def split(source: Path, root: Path | None = None) -> int:
+    """Shard a whole-file progress.json. Returns the number of month shards written."""
+    root = root or SHARD_DIR
+    with open(source) as f:
+        progress = json.load(f)
+    log = progress.pop("daily_log", {})
+    with progress_lock():
+        _write_milestones(root, progress)
+        sharded = ShardedLog(root)
+        for day, ids in log.items():
+            sharded[day] = ids
+        return len(sharded.flush())
+
+
+def load() -> dict:
+    """Milestone state now; daily_log months only when they're read."""
+    if not (SHARD_DIR / "milestones.json").exists() and PROGRESS_FILE.exists():
+        split(PROGRESS_FILE)
+    progress = _read_milestones(SHARD_DIR)
+    progress["daily_log"] = ShardedLog()
+    return progress
+
+
+def save(progress: dict) -> None:
+    with progress_lock():
+        milestones = {k: v for k, v in progress.items() if k != "daily_log"}
+        if _dump(milestones) != _dump(_read_milestones(SHARD_DIR)):
+            _write_milestones(SHARD_DIR, milestones)
+        log = progress.get("daily_log", {})
+        if not isinstance(log, ShardedLog):
+            # A plain dict: compare it month by month with what's stored.
+            sharded = ShardedLog()
+            for month in set(sharded.manifest["months"]) | {day[:7] for day in log}:
+                shard = sharded._shard(month)
+                shard.clear()
+                shard.update((day, ids) for day, ids in log.items() if day[:7] == month)
+            log = sharded
+        log.flush()
+
+
+def complete(milestone_id: str, day: date) -> None:
+    with progress_lock():
+        milestones = _read_milestones(SHARD_DIR)
+        milestones[milestone_id] = {"completed": True, "completed_date": day.isoformat()}
+        _write_milestones(SHARD_DIR, milestones)
+
+
+def check(milestone_id: str, day: date, checked: bool = True) -> None:
+    with progress_lock():
+        log = ShardedLog()
+        entries = log.setdefault(day.isoformat(), [])
+        if checked and milestone_id not in entries:
+            entries.append(milestone_id)
+        elif not checked and milestone_id in entries:
+            entries.remove(milestone_id)
+        log.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Month-sharded progress store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cmd = sub.add_parser("split", help="Shard an existing progress.json")
+    cmd.add_argument("source", nargs="?", default=str(PROGRESS_FILE))
+    args = parser.parse_args()
+
+    months = split(Path(args.source))
+    print(f"Wrote {months} month shards to {SHARD_DIR}")
+
+
+if __name__ == "__main__":
+    main()
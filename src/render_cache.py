@@ -0,0 +1,93 @@
+"""
+Rendered reminders and delivery receipts, so reruns on the same day neither re-render nor
+re-send.
+
+Renders are memoized on (date, content hash), where the content hash covers the roadmap
+file, the stored progress and the rendering options (e.g. whether forecasts are on). Receipts are kept per (date, recipient): once a recipient has
+that day's reminder, later runs skip them even if progress changed in between. Recipients
+are stored as a hash of the user key, so the secret itself is never written.
+
+Entries older than REMINDER_CACHE_DAYS (default 14) are dropped on save.
+"""
+
+import hashlib
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from progress import DATA_DIR, atomic_write, progress_hash
+from roadmap import roadmap_hash
+
+CACHE_FILE = DATA_DIR / ".cache" / "reminders.json"
+
+
+def content_hash(options: str = "") -> str:
+    """Identify what today's message is rendered from: the roadmap, progress and options."""
+    return hashlib.sha256(f"{roadmap_hash()}:{progress_hash()}:{options}".encode()).hexdigest()[:16]
+
+
+def recipient_tag(user: str) -> str:
+    return hashlib.sha256(user.encode()).hexdigest()[:16]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class RenderCache:
+    """The reminders cache file, loaded into memory; call save() to write it back."""
+
+    def __init__(self, entries: dict | None = None, receipts: dict | None = None, path: Path | None = None):
+        self.entries = entries or {}  # "date|content" -> rendered title and message
+        self.receipts = receipts or {}  # date -> {recipient tag: receipt}
+        self.path = path or CACHE_FILE
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> "RenderCache":
+        path = path or CACHE_FILE
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            entries, receipts = data["entries"], data.get("receipts", {})
+        except (OSError, ValueError, KeyError, TypeError):
+            entries, receipts = {}, {}  # missing or unreadable: start over, worst case one extra send
+        # Files written before receipts moved out kept them on each entry.
+        for entry in entries.values():
+            receipts.setdefault(entry["date"], {}).update(entry.pop("receipts", {}))
+        return cls(entries, receipts, path)
+
+    def get(self, day: date, content: str) -> dict | None:
+        return self.entries.get(f"{day.isoformat()}|{content}")
+
+    def put(self, day: date, content: str, title: str, message: str) -> dict:
+        entry = {"date": day.isoformat(), "created": _now(), "title": title, "message": message}
+        self.entries[f"{day.isoformat()}|{content}"] = entry
+        return entry
+
+    def was_sent(self, day: date, user: str) -> bool:
+        return recipient_tag(user) in self.receipts.get(day.isoformat(), {})
+
+    def record(self, day: date, user: str, request_id: str | None) -> None:
+        self.receipts.setdefault(day.isoformat(), {})[recipient_tag(user)] = {
+            "request_id": request_id, "sent_at": _now(),
+        }
+
+    def evict(self, max_age_days: int | None = None) -> int:
+        """Drop renders created, and receipts dated, more than max_age_days ago. Returns how many."""
+        if max_age_days is None:
+            max_age_days = int(os.getenv("REMINDER_CACHE_DAYS", "14"))
+        now = datetime.now(timezone.utc)
+        cutoff = (now - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+        stale = [key for key, entry in self.entries.items() if entry["created"] < cutoff]
+        for key in stale:
+            del self.entries[key]
+        old_days = [day for day in self.receipts if day < cutoff[:10]]
+        for day in old_days:
+            del self.receipts[day]
+        return len(stale) + len(old_days)
+
+    def save(self) -> None:
+        self.evict()
+        data = {"entries": self.entries, "receipts": self.receipts}
+        atomic_write(self.path, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
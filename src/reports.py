@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Completion reports for any date window: weekly, monthly, quarterly and per phase.
+
+Completions come from the progress completion-date index (progress.completion_index),
+so a window costs O(log n + k) for k completions in it rather than a scan of every
+milestone. Check-ins are counted from daily_log for the days in the window.
+
+Usage:
+    python src/reports.py week [--date 2026-10-19]     # Monday-Sunday week holding the date
+    python src/reports.py month|quarter [--date ...]
+    python src/reports.py phase [--phase fall-2026]    # every phase if --phase is left out
+    python src/reports.py month --json
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date, timedelta
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from progress import completion_index, load_progress, phase_stats
+from roadmap import PHASES
+
+
+def week_window(day: date) -> tuple[date, date]:
+    monday = day - timedelta(days=day.weekday())
+    return monday, monday + timedelta(days=6)
+
+
+def month_window(day: date) -> tuple[date, date]:
+    first = day.replace(day=1)
+    following = (first + timedelta(days=32)).replace(day=1)
+    return first, following - timedelta(days=1)
+
+
+def quarter_window(day: date) -> tuple[date, date]:
+    first = date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+    following = date(first.year + (first.month == 10), (first.month + 2) % 12 + 1, 1)
+    return first, following - timedelta(days=1)
+
+
+def _checkins(progress: dict, first: date, last: date) -> tuple[int, int]:
+    """(check-ins, days with at least one) in [first, last]."""
+    log = progress.get("daily_log") or {}
+    if hasattr(log, "between"):  # month-sharded log: load only the overlapping months
+        days = log.between(first, last).values()
+    else:
+        days = (log.get((first + timedelta(days=n)).isoformat()) for n in range((last - first).days + 1))
+    total = active = 0
+    for ids in days:
+        if ids:
+            total += len(ids)
+            active += 1
+    return total, active
+
+
+def window_report(progress: dict, first: date, last: date, title: str | None = None) -> dict:
+    """What was completed and checked in over [first, last]."""
+    done = completion_index(progress).between(first, last)
+    by_phase: dict[str, int] = {}
+    for _, m in done:
+        by_phase[m["phase"]] = by_phase.get(m["phase"], 0) + 1
+    checkins, active_days = _checkins(progress, first, last)
+    return {
+        "title": title or f"{first.isoformat()} to {last.isoformat()}",
+        "from": first.isoformat(),
+        "to": last.isoformat(),
+        "completed": [{"date": cd, "id": m["id"], "title": m["title"], "phase": m["phase"]} for cd, m in done],
+        "by_phase": by_phase,
+        "checkins": checkins,
+        "active_days": active_days,
+    }
+
+
+def weekly_report(progress: dict, day: date) -> dict:
+    first, last = week_window(day)
+    return window_report(progress, first, last, f"Week of {first.strftime('%b %d, %Y')}")
+
+
+def monthly_report(progress: dict, day: date) -> dict:
+    first, last = month_window(day)
+    return window_report(progress, first, last, first.strftime("%B %Y"))
+
+
+def quarterly_report(progress: dict, day: date) -> dict:
+    first, last = quarter_window(day)
+    return window_report(progress, first, last, f"Q{(first.month - 1) // 3 + 1} {first.year}")
+
+
+def phase_report(progress: dict, phase_key: str) -> dict:
+    """Completions and check-ins over a phase's dates, plus how much of the phase is done."""
+    phase = PHASES[phase_key]
+    report = window_report(progress, phase["start"], phase["end"], phase["label"])
+    report["phase_completed"], report["phase_total"] = phase_stats(progress).get(phase_key, (0, 0))
+    return report
+
+
+def format_report(report: dict) -> str:
+    lines = [report["title"], f"{report['from']} to {report['to']}"]
+    if "phase_total" in report:
+        lines.append(f"Phase progress: {report['phase_completed']}/{report['phase_total']} milestones")
+    lines.append(f"Check-ins: {report['checkins']} over {report['active_days']} day(s)")
+    if report["completed"]:
+        lines.append(f"Completed in this window ({len(report['completed'])}):")
+        for c in report["completed"]:
+            lines.append(f"  + {c['date']}  {c['title']}")
+        lines.append("By phase: " + ", ".join(f"{PHASES.get(k, {}).get('label', k)} {n}" for k, n in report["by_phase"].items()))
+    else:
+        lines.append("Completed in this window: nothing")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Completion reports for a week, month, quarter or phase")
+    parser.add_argument("period", choices=["week", "month", "quarter", "phase"])
+    parser.add_argument("--date", type=str, help="A date inside the period (YYYY-MM-DD); default today")
+    parser.add_argument("--phase", choices=list(PHASES), help="Phase for 'phase' reports (default: all)")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args()
+
+    progress = load_progress()
+    day = date.fromisoformat(args.date) if args.date else date.today()
+    if args.period == "phase":
+        reports = [phase_report(progress, key) for key in ([args.phase] if args.phase else PHASES)]
+    else:
+        build = {"week": weekly_report, "month": monthly_report, "quarter": quarterly_report}[args.period]
+        reports = [build(progress, day)]
+
+    if args.json:
+        print(json.dumps(reports if len(reports) > 1 else reports[0], indent=2, ensure_ascii=False))
+    else:
+        print("\n\n".join(format_report(r) for r in reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,295 +1,267 @@
 """
-Full roadmap data: phases, milestones, daily actions, and deadlines.
+Roadmap data: phases, milestones, daily actions, and deadlines.
+
+The definitions live in data/roadmap.json (or a .toml file with the same layout, named by
+ROADMAP_FILE). Each milestone has an id, phase, title, start/end dates, daily_action (what
+to do each day), and optional deadline for one-off items. The file is validated once and
+the parsed result, date index included, is cached under data/.cache until the file changes.
 """
 
+import os
+import pickle
+from bisect import bisect_left, bisect_right
 from datetime import date
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+ROADMAP_FILE = Path(os.getenv("ROADMAP_FILE") or DATA_DIR / "roadmap.json")
+CACHE_DIR = DATA_DIR / ".cache"
+
+_CACHE_VERSION = 1
+_MILESTONE_TEXT = ("id", "phase", "title")
+
+
+def due_date(milestone: dict) -> date:
+    """The date a milestone is due: its deadline if it has one, otherwise its end."""
+    return milestone.get("deadline") or milestone["end"]
+
+
+class _IntervalTree:
+    """Centered interval tree over closed [start, end] intervals tagged with a position.
+
+    Built once, then answers "which intervals contain day D" in O(log n + k).
+    """
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, intervals: list[tuple[date, date, int]]):
+        points = sorted(p for start, end, _ in intervals for p in (start, end))
+        self.center = points[len(points) // 2]
+        here, left, right = [], [], []
+        for iv in intervals:
+            if iv[1] < self.center:
+                left.append(iv)
+            elif iv[0] > self.center:
+                right.append(iv)
+            else:
+                here.append(iv)
+        self.by_start = sorted(here, key=lambda iv: iv[0])
+        self.by_end = sorted(here, key=lambda iv: iv[1], reverse=True)
+        self.left = _IntervalTree(left) if left else None
+        self.right = _IntervalTree(right) if right else None
+
+    def stab(self, day: date) -> list[int]:
+        """Return the positions of all intervals containing day (unordered)."""
+        hits = []
+        node = self
+        while node is not None:
+            if day < node.center:
+                for start, _, pos in node.by_start:
+                    if start > day:
+                        break
+                    hits.append(pos)
+                node = node.left
+            elif day > node.center:
+                for _, end, pos in node.by_end:
+                    if end < day:
+                        break
+                    hits.append(pos)
+                node = node.right
+            else:
+                hits.extend(pos for _, _, pos in node.by_start)
+                break
+        return hits
+
+
+class MilestoneIndex:
+    """Prebuilt date index over a list of milestones.
+
+    Results come back in list order (or due-date order for due_between), exactly as the
+    equivalent linear scans would return them.
+    """
+
+    def __init__(self, milestones: list[dict]):
+        self.milestones = milestones
+        self.size = len(milestones)
+        intervals = [(m["start"], m["end"], i) for i, m in enumerate(milestones)]
+        self._tree = _IntervalTree(intervals) if intervals else None
+        dues = sorted((due_date(m), i) for i, m in enumerate(milestones))
+        self._due_dates = [d for d, _ in dues]
+        self._due_order = [i for _, i in dues]
+
+    def active_on(self, day: date) -> list[dict]:
+        """Milestones with start <= day <= end."""
+        if self._tree is None:
+            return []
+        return [self.milestones[i] for i in sorted(self._tree.stab(day))]
+
+    def due_before(self, day: date) -> list[dict]:
+        """Milestones whose deadline/end falls strictly before day."""
+        stop = bisect_left(self._due_dates, day)
+        return [self.milestones[i] for i in sorted(self._due_order[:stop])]
+
+    def due_between(self, first: date, last: date) -> list[tuple[dict, date]]:
+        """(milestone, due date) pairs with first <= due <= last, ordered by due date."""
+        lo = bisect_left(self._due_dates, first)
+        hi = bisect_right(self._due_dates, last)
+        return [(self.milestones[self._due_order[j]], self._due_dates[j]) for j in range(lo, hi)]
+
+
+class RoadmapError(ValueError):
+    """A roadmap file that is missing fields, has bad dates or refers to unknown phases."""
+
+
+def _parse_day(value, where: str) -> date:
+    if type(value) is date:  # TOML dates arrive parsed
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    raise RoadmapError(f"{where}: expected a YYYY-MM-DD date, got {value!r}")
+
+
+def _read_source(path: Path, raw: bytes) -> dict:
+    if path.suffix == ".toml":
+        import tomllib
+        return tomllib.loads(raw.decode())
+    import json
+    return json.loads(raw)
+
+
+def _validate(path: Path, data: dict) -> tuple[list[dict], dict]:
+    """Check the raw definitions and return (ROADMAP, PHASES) with dates parsed."""
+    if not isinstance(data, dict) or not isinstance(data.get("phases"), dict) \
+            or not isinstance(data.get("milestones"), list):
+        raise RoadmapError(f"{path}: expected a 'phases' table and a 'milestones' list")
+
+    phases = {}
+    for key, raw in data["phases"].items():
+        where = f"{path}: phase {key!r}"
+        if not isinstance(raw, dict) or not isinstance(raw.get("label"), str):
+            raise RoadmapError(f"{where}: needs a label")
+        phase = dict(raw)
+        phase["start"] = _parse_day(raw.get("start"), f"{where} start")
+        phase["end"] = _parse_day(raw.get("end"), f"{where} end")
+        if phase["start"] > phase["end"]:
+            raise RoadmapError(f"{where}: ends before it starts")
+        phases[key] = phase
+
+    milestones, seen = [], set()
+    for n, raw in enumerate(data["milestones"]):
+        where = f"{path}: milestone {raw.get('id', n) if isinstance(raw, dict) else n!r}"
+        if not isinstance(raw, dict):
+            raise RoadmapError(f"{where}: expected a table")
+        for field in _MILESTONE_TEXT:
+            if not isinstance(raw.get(field), str) or not raw[field]:
+                raise RoadmapError(f"{where}: missing {field}")
+        if raw["id"] in seen:
+            raise RoadmapError(f"{where}: duplicate id")
+        if raw["id"] in ("daily_log", "schema_version"):
+            raise RoadmapError(f"{where}: {raw['id']!r} is reserved")
+        if raw["phase"] not in phases:
+            raise RoadmapError(f"{where}: unknown phase {raw['phase']!r}")
+        if not isinstance(raw.get("daily_action"), (str, type(None))):
+            raise RoadmapError(f"{where}: daily_action must be text or null")
+        seen.add(raw["id"])
+        m = dict(raw)
+        m.setdefault("daily_action", None)  # one-off items; TOML has no null
+        m["start"] = _parse_day(raw.get("start"), f"{where} start")
+        m["end"] = _parse_day(raw.get("end"), f"{where} end")
+        if m["start"] > m["end"]:
+            raise RoadmapError(f"{where}: ends before it starts")
+        if "deadline" in raw:
+            m["deadline"] = _parse_day(raw["deadline"], f"{where} deadline")
+        milestones.append(m)
+    return milestones, phases
+
+
+def _cache_path(path: Path) -> Path:
+    import zlib
+    return CACHE_DIR / f"{path.stem}-{zlib.crc32(str(path).encode()):08x}.pickle"
+
+
+def _compile(path: Path) -> dict:
+    """Return the cached compile of path, revalidating only when the file has changed.
+
+    A matching mtime and size skips reading the source at all. Otherwise the source is
+    hashed, and an unchanged hash (a touch, a fresh checkout) just refreshes the stamp.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_file = _cache_path(path)
+    cached = None
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("version") != _CACHE_VERSION:
+            cached = None
+    except Exception:  # unreadable, truncated, or pickled by other code: rebuild it
+        cached = None
+    if cached is not None and cached["stamp"] == stamp:
+        return cached
+
+    import hashlib
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached is None or cached["sha256"] != digest:
+        milestones, phases = _validate(path, _read_source(path, raw))
+        cached = {"version": _CACHE_VERSION, "sha256": digest, "roadmap": milestones,
+                  "phases": phases, "index": MilestoneIndex(milestones)}
+    cached["stamp"] = stamp
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # read-only checkout: still correct, just not cached
+    return cached
+
+
+def load_roadmap(path: Path | str = ROADMAP_FILE) -> tuple[list[dict], dict]:
+    """Load (ROADMAP, PHASES) from a roadmap file. Raises RoadmapError if it is invalid."""
+    compiled = _compile(path)
+    return compiled["roadmap"], compiled["phases"]
+
+
+def roadmap_hash(path: Path | str = ROADMAP_FILE) -> str:
+    """SHA-256 of the roadmap file's contents, as recorded at its last compile."""
+    return _compile(path)["sha256"]
+
+
+_loaded = _compile(ROADMAP_FILE)
+ROADMAP: list[dict] = _loaded["roadmap"]
+PHASES: dict = _loaded["phases"]
+
+_index: MilestoneIndex | None = _loaded["index"]
+_phase_index: tuple | None = None
+
 
-# Each milestone has an id, description, phase, start/end dates, daily_action (what to do each day),
-# and optional deadline for one-off items.
-
-ROADMAP = [
-    # ── Phase 1: Now → May 2026 (Final Semester) ──
-    {
-        "id": "calc3",
-        "phase": "spring-2026",
-        "title": "Crawl core: Finish Calculus 3 strong (target A)",
-        "daily_action": "3-5 Calc 3 practice problems (30 min)",
-        "start": date(2026, 1, 13),
-        "end": date(2026, 5, 8),
-    },
-    {
-        "id": "linalg",
-        "phase": "spring-2026",
-        "title": "Crawl core: Finish Linear Algebra strong (target A)",
-        "daily_action": "3-5 Linear Algebra practice problems (30 min)",
-        "start": date(2026, 1, 13),
-        "end": date(2026, 5, 8),
-    },
-    {
-        "id": "econ4960r",
-        "phase": "spring-2026",
-        "title": "Crawl core: Finish ECON 4960R (quant-focused research)",
-        "daily_action": "45 min on research data/analysis/writing",
-        "start": date(2026, 1, 13),
-        "end": date(2026, 5, 8),
-    },
-    {
-        "id": "hull_derivatives_spring",
-        "phase": "spring-2026",
-        "title": "Crawl core: Finish Hull (first pass + problems)",
-        "daily_action": "10-20 pages Hull + notes/problems (30-45 min)",
-        "start": date(2026, 1, 13),
-        "end": date(2026, 5, 31),
-    },
-    {
-        "id": "rust_book",
-        "phase": "spring-2026",
-        "title": "Crawl core: Finish Rust book + build chapter projects",
-        "daily_action": "Rust book + code-along + one exercise/project rep (30-45 min)",
-        "start": date(2026, 1, 13),
-        "end": date(2026, 5, 31),
-    },
-    # ── Phase 2: June–August 2026 (Summer → Start at Brown Advisory) ──
-    {
-        "id": "diff_eq",
-        "phase": "summer-2026",
-        "title": "Walk [Math]: Differential Equations (MIT OCW 18.03, ODE intuition + reps)",
-        "daily_action": "45-60 min DiffEq lecture/problems + short derivation notes",
-        "start": date(2026, 6, 1),
-        "end": date(2026, 8, 31),
-    },
-    {
-        "id": "probability_ross",
-        "phase": "summer-2026",
-        "title": "Walk [Math]: Probability (Ross) + problem solving for interviews/coursework",
-        "daily_action": "Ross reading + 5-10 probability problems (45 min)",
-        "start": date(2026, 6, 1),
-        "end": date(2026, 8, 31),
-    },
-    {
-        "id": "advanced_sql",
-        "phase": "summer-2026",
-        "title": "Walk [Coding]: Advanced SQL (CTEs, window functions, analytics queries)",
-        "daily_action": "One LeetCode SQL problem (20 min)",
-        "start": date(2026, 6, 1),
-        "end": date(2026, 8, 31),
-    },
-    {
-        "id": "scipy_statsmodels",
-        "phase": "summer-2026",
-        "title": "Walk [Coding]: SciPy + statsmodels (regression, time series, GARCH)",
-        "daily_action": "Implement one regression/time-series/stat model (30-45 min)",
-        "start": date(2026, 6, 1),
-        "end": date(2026, 8, 31),
-    },
-    {
-        "id": "numerical_methods",
-        "phase": "summer-2026",
-        "title": "Walk [Math]: Numerical methods foundations (root finding, optimization, Monte Carlo)",
-        "daily_action": "One numerical methods concept + implementation rep (30-45 min)",
-        "start": date(2026, 6, 1),
-        "end": date(2026, 8, 31),
-    },
-    {
-        "id": "take_gre",
-        "phase": "summer-2026",
-        "title": "Take the GRE — target 169+ Quant",
-        "daily_action": None,
-        "deadline": date(2026, 8, 15),
-        "start": date(2026, 6, 1),
-        "end": date(2026, 8, 15),
-    },
-    {
-        "id": "brown_start",
-        "phase": "summer-2026",
-        "title": "Start at Brown Advisory — crush first 90 days",
-        "daily_action": "Show up, learn fast, build relationships",
-        "start": date(2026, 7, 1),
-        "end": date(2026, 9, 30),
-    },
-    {
-        "id": "git_mastery",
-        "phase": "summer-2026",
-        "title": "Walk [Coding]: Git/GitHub workflows mastery",
-        "daily_action": "Practice Git workflows + cleaner commit habits (20-30 min)",
-        "start": date(2026, 6, 1),
-        "end": date(2026, 7, 31),
-    },
-    # ── Phase 3: Sept–Dec 2026 (Building at Brown Advisory) ──
-    {
-        "id": "real_analysis",
-        "phase": "fall-2026",
-        "title": "Walk [Math]: Real Analysis foundations (Abbott, selected sections)",
-        "daily_action": "Abbott reading + proof practice (45 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "shreve_vol1",
-        "phase": "fall-2026",
-        "title": "Walk [Math]: Shreve Vol I (discrete-time stochastic calculus)",
-        "daily_action": "Shreve reading + worked examples/notes (45 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "hull_derivatives",
-        "phase": "fall-2026",
-        "title": "Walk [Finance]: Hull second pass (deeper chapters + harder problems)",
-        "daily_action": "One section Hull + worked problems + formula notes (30-45 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "portfolio_theory",
-        "phase": "fall-2026",
-        "title": "Walk [Finance]: Portfolio theory (Markowitz, Black-Litterman, factors)",
-        "daily_action": "Portfolio theory study + small implementation reps (30-45 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "cpp_oop",
-        "phase": "fall-2026",
-        "title": "Walk [Coding]: C++ for quant (OOP, STL, templates)",
-        "daily_action": "C++ practice (syntax + STL/problem) (30 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "sklearn_ml",
-        "phase": "fall-2026",
-        "title": "Walk [Coding]: Numerical methods / optimization / ML basics (SciPy + sklearn)",
-        "daily_action": "Alternate days: optimization/numerical methods and ML exercises (30-45 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "stochastic_processes_intro",
-        "phase": "fall-2026",
-        "title": "Walk [Math]: Stochastic processes intro (Markov chains, Brownian motion intuition)",
-        "daily_action": "Stochastic processes reading + notes/problem rep (30-45 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "rec_letters",
-        "phase": "fall-2026",
-        "title": "Run prep: Lock recommendation letters (faculty + work)",
-        "daily_action": None,
-        "deadline": date(2026, 12, 15),
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 15),
-    },
-    {
-        "id": "quant_projects",
-        "phase": "fall-2026",
-        "title": "Walk [Projects] -> Run bridge: Build quant projects (optimizer, factor/momentum backtests)",
-        "daily_action": "Quant project coding + writeup progress (45-60 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "work_analytics",
-        "phase": "fall-2026",
-        "title": "Walk [Projects]: Portfolio analytics projects at work",
-        "daily_action": "Look for analytics opportunities at Brown Advisory",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    {
-        "id": "work_python_tools",
-        "phase": "fall-2026",
-        "title": "Walk [Projects]: Python tools that solve real problems at Brown Advisory",
-        "daily_action": "Build/improve a Python tool for work (30 min)",
-        "start": date(2026, 9, 1),
-        "end": date(2026, 12, 31),
-    },
-    # ── Phase 4: Jan–March 2027 (Application Sprint) ──
-    {
-        "id": "sop_draft",
-        "phase": "apps-2027",
-        "title": "Run (MFE apps): Draft and finalize Statement of Purpose",
-        "daily_action": "SoP drafting/revisions + school-specific tailoring (45 min)",
-        "start": date(2027, 1, 1),
-        "end": date(2027, 2, 28),
-    },
-    {
-        "id": "grinold_kahn",
-        "phase": "apps-2027",
-        "title": "Run reading: Grinold & Kahn (support portfolio/risk project depth)",
-        "daily_action": "Read + extract ideas for projects/interviews (30 min)",
-        "start": date(2027, 1, 1),
-        "end": date(2027, 3, 31),
-    },
-    {
-        "id": "portfolio_dashboard",
-        "phase": "apps-2027",
-        "title": "Run project: Interactive portfolio dashboard (Streamlit/Dash)",
-        "daily_action": "Build/polish dashboard + docs/screenshots (45 min)",
-        "start": date(2027, 1, 1),
-        "end": date(2027, 2, 28),
-    },
-    {
-        "id": "app_gatech",
-        "phase": "apps-2027",
-        "title": "Run (MFE apps): Submit Georgia Tech MSQCF application",
-        "daily_action": None,
-        "deadline": date(2027, 3, 1),
-        "start": date(2027, 1, 1),
-        "end": date(2027, 3, 1),
-    },
-    {
-        "id": "app_others",
-        "phase": "apps-2027",
-        "title": "Run (MFE apps): Submit NC State, UNC Charlotte, JHU applications",
-        "daily_action": None,
-        "deadline": date(2027, 3, 15),
-        "start": date(2027, 1, 1),
-        "end": date(2027, 3, 15),
-    },
-    {
-        "id": "github_portfolio",
-        "phase": "apps-2027",
-        "title": "Run deliverable: GitHub portfolio (3+ well-documented quant repos)",
-        "daily_action": "Polish repos, READMEs, and project writeups (30-45 min)",
-        "start": date(2027, 1, 1),
-        "end": date(2027, 3, 15),
-    },
-    {
-        "id": "quant_interview_prep",
-        "phase": "apps-2027",
-        "title": "Run prep: Quant interview drills (probability, stats, coding, market intuition)",
-        "daily_action": "45 min quant interview drills (probability/stats/coding/finance)",
-        "start": date(2027, 1, 1),
-        "end": date(2027, 3, 31),
-    },
-    {
-        "id": "mfe_application_assets",
-        "phase": "apps-2027",
-        "title": "Run deliverable: MFE application assets (resume, project summaries, coding writeups)",
-        "daily_action": "Polish resume + project summaries + application short answers (30-45 min)",
-        "start": date(2027, 1, 1),
-        "end": date(2027, 3, 31),
-    },
-]
-
-PHASES = {
-    "spring-2026": {"label": "Crawl — Foundations (Spring 2026)", "start": date(2026, 1, 13), "end": date(2026, 5, 31)},
-    "summer-2026": {"label": "Walk — Core Quant Buildout I (Summer 2026)", "start": date(2026, 6, 1), "end": date(2026, 9, 30)},
-    "fall-2026": {"label": "Walk — Core Quant Buildout II (Fall 2026)", "start": date(2026, 9, 1), "end": date(2026, 12, 31)},
-    "apps-2027": {"label": "Run — Quant Projects + MFE Applications (Jan–Mar 2027)", "start": date(2027, 1, 1), "end": date(2027, 3, 31)},
-}
+def get_index() -> MilestoneIndex:
+    """Return the index for ROADMAP, rebuilding it if the list was replaced or resized."""
+    global _index
+    if _index is None or _index.milestones is not ROADMAP or _index.size != len(ROADMAP):
+        _index = MilestoneIndex(ROADMAP)
+    return _index
 
 
 def get_active_milestones(today: date) -> list[dict]:
     """Return milestones that are active on the given date (between start and end)."""
-    return [m for m in ROADMAP if m["start"] <= today <= m["end"]]
+    return get_index().active_on(today)
 
 
 def get_current_phase(today: date) -> str | None:
     """Return the phase key for today's date."""
-    for key, phase in PHASES.items():
-        if phase["start"] <= today <= phase["end"]:
-            return key
-    return None
+    global _phase_index
+    if _phase_index is None or _phase_index[0] is not PHASES or len(_phase_index[1]) != len(PHASES):
+        keys = list(PHASES)
+        intervals = [(PHASES[k]["start"], PHASES[k]["end"], i) for i, k in enumerate(keys)]
+        _phase_index = (PHASES, keys, _IntervalTree(intervals) if intervals else None)
+    _, keys, tree = _phase_index
+    hits = tree.stab(today) if tree else []
+    # Phases overlap at the edges; the first one listed wins, as in a linear scan.
+    return keys[min(hits)] if hits else None
@@ -0,0 +1,196 @@
+"""
+Long-running reminder scheduler: one resident process that sends exactly on time.
+
+Every recipient has its own timezone and local send time. Their next fire times sit in a
+heap; the daemon sleeps until the earliest one, renders the message for that
+recipient's local date and sends it. The roadmap stays loaded, and progress is re-read
+only when its files change.
+
+Recipients come from a JSON schedule file:
+
+    {"recipients": [
+        {"user": "${PUSHOVER_USER_KEY}", "timezone": "America/New_York", "hour": 7, "minute": 30},
+        {"user": "${LONDON_USER_KEY}", "timezone": "Europe/London", "hour": 8, "minute": 0}
+    ]}
+
+"user" may name environment variables (${VAR}) and hold several comma-separated keys.
+Without a file, every key in PUSHOVER_USER_KEY gets TARGET_ET_HOUR:TARGET_ET_MINUTE US
+Eastern, the same time the cron workflow aims for.
+
+Run it with `python src/send_reminder.py --daemon [--schedule schedule.json] [--dry-run]`.
+"""
+
+import heapq
+import json
+import os
+import signal
+import sys
+import threading
+import traceback
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import progress as progress_store
+from progress import load_progress
+
+DEFAULT_TZ = "America/New_York"
+
+# The wait uses the monotonic clock, which doesn't track wall-clock steps or time spent
+# suspended. Waking at least this often bounds how late either can make a send.
+MAX_SLEEP = 900
+
+
+@dataclass(frozen=True)
+class Recipient:
+    user: str
+    tz: ZoneInfo
+    hour: int
+    minute: int
+
+    def next_fire(self, after: datetime) -> datetime:
+        """The first local hour:minute strictly after `after`, in UTC."""
+        after = after.astimezone(timezone.utc)
+        day = after.astimezone(self.tz).date()
+        while True:
+            fire = datetime(day.year, day.month, day.day, self.hour, self.minute, tzinfo=self.tz)
+            if fire > after:
+                return fire.astimezone(timezone.utc)
+            day += timedelta(days=1)
+
+    def local_date(self, fire_at: datetime) -> date:
+        return fire_at.astimezone(self.tz).date()
+
+
+def load_schedule(path: str | Path | None = None) -> list[Recipient]:
+    """Read recipients from a schedule file, or build the default one from the environment."""
+    if path:
+        with open(path) as f:
+            entries = json.load(f)["recipients"]
+    else:
+        entries = [{
+            "user": "${PUSHOVER_USER_KEY}",
+            "timezone": DEFAULT_TZ,
+            "hour": int(os.getenv("TARGET_ET_HOUR", "7")),
+            "minute": int(os.getenv("TARGET_ET_MINUTE", "30")),
+        }]
+
+    recipients = []
+    for entry in entries:
+        hour, minute = int(entry.get("hour", 7)), int(entry.get("minute", 30))
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"Bad send time {hour:02d}:{minute:02d} in schedule")
+        tz = ZoneInfo(entry.get("timezone", DEFAULT_TZ))
+        for key in os.path.expandvars(entry["user"]).split(","):
+            if key.strip() and "$" not in key:
+                recipients.append(Recipient(key.strip(), tz, hour, minute))
+    return recipients
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class WarmProgress:
+    """Progress held in memory and re-read only when the backend's files change."""
+
+    def __init__(self):
+        self._progress = None
+        self._stamp = None
+
+    def get(self) -> dict:
+        # Stat before loading: a write landing mid-load then shows up as a change next time.
+        stamp = tuple((str(p), _stat(p)) for p in progress_store.store_files())
+        if self._progress is None or stamp != self._stamp:
+            self._progress = load_progress()
+            self._stamp = stamp
+        return self._progress
+
+
+def _log(text: str) -> None:
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    print(f"[{now}] {text}", flush=True)
+
+
+class Scheduler:
+    """Heap of (next fire time, recipient), drained in time order.
+
+    render(today, progress) returns (title, message); deliver(users, title, message)
+    sends it. Recipients due at the same moment with the same local date share one
+    render and one batch of sends. A fire more than `grace` late (the machine was asleep,
+    say) is skipped rather than sent hours off schedule.
+    """
+
+    def __init__(self, recipients: list[Recipient], render, deliver,
+                 grace: timedelta = timedelta(hours=1)):
+        self.recipients = recipients
+        self.render = render
+        self.deliver = deliver
+        self.grace = grace
+        self.progress = WarmProgress()
+        self._heap: list[tuple[datetime, int, Recipient]] = []
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def upcoming(self) -> list[tuple[datetime, Recipient]]:
+        return [(fire_at, r) for fire_at, _, r in sorted(self._heap)]
+
+    def run(self, now: datetime | None = None) -> None:
+        now = now or datetime.now(timezone.utc)
+        self._heap = [(r.next_fire(now), i, r) for i, r in enumerate(self.recipients)]
+        heapq.heapify(self._heap)
+        for fire_at, r in self.upcoming():
+            _log(f"{r.user[:4]}... next at {fire_at.astimezone(r.tz):%Y-%m-%d %H:%M %Z}")
+
+        while self._heap and not self._stop.is_set():
+            delay = (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+            if delay > 0:
+                self._stop.wait(min(delay, MAX_SLEEP))
+                continue
+            now = datetime.now(timezone.utc)
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                fire_at, i, r = heapq.heappop(self._heap)
+                due.append((fire_at, r))
+                heapq.heappush(self._heap, (r.next_fire(now), i, r))
+            try:
+                self._fire(due, now)
+            except Exception:
+                # One bad send (network down, a corrupt progress edit) mustn't end the daemon.
+                traceback.print_exc()
+
+    def _fire(self, due: list[tuple[datetime, Recipient]], now: datetime) -> None:
+        by_day: dict[date, list[str]] = {}
+        for fire_at, r in due:
+            if now - fire_at > self.grace:
+                _log(f"Skipped {r.user[:4]}...: woke {now - fire_at} after its send time")
+                continue
+            by_day.setdefault(r.local_date(fire_at), []).append(r.user)
+        if not by_day:
+            return
+        progress = self.progress.get()
+        for today, users in sorted(by_day.items()):
+            title, message = self.render(today, progress)
+            _log(f"Sending {today.isoformat()} reminder to {len(users)} recipient(s)")
+            self.deliver(users, title, message)
+
+
+def run_daemon(schedule: str | None, render, deliver) -> None:
+    """Run the scheduler in the foreground until SIGTERM or Ctrl-C."""
+    recipients = load_schedule(schedule)
+    if not recipients:
+        sys.exit("No recipients: set PUSHOVER_USER_KEY or pass --schedule")
+    scheduler = Scheduler(recipients, render, deliver)
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        pass
+    _log("Scheduler stopped")
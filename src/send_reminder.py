@@ -4,23 +4,32 @@ Builds the daily reminder message and sends it via Pushover.
 Usage:
     python send_reminder.py            # Send push notification
     python send_reminder.py --dry-run  # Print message, don't send
+    python send_reminder.py --from 2026-06-01 --to 2026-12-31 [--output out.jsonl]
+                                       # Render every day in the range as JSON lines
+    python send_reminder.py --dry-run --profile [--profile-out run.prof]
+                                       # Per-stage timings as a JSON line on stderr
+    python send_reminder.py --daemon [--schedule schedule.json]
+                                       # Stay resident and send at each recipient's local time
 """
 
-import argparse
-import json
 import os
-import subprocess
 import sys
 from datetime import date, timedelta, datetime
-from zoneinfo import ZoneInfo
 
-from dotenv import load_dotenv
+# This runs as a short-lived process, so modules only some paths need (argparse, dotenv,
+# zoneinfo, json, the HTTP client) are imported where they're used. benchmarks/startup.py keeps
+# the cold start within budget.
 
-# Allow imports from src/
-sys.path.insert(0, os.path.dirname(__file__))
+# Allow imports from src/ when imported from elsewhere (running the script already does)
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
-from progress import get_stats, is_completed, load_progress
-from roadmap import PHASES, ROADMAP, get_active_milestones, get_current_phase
+from profiling import NULL_PROFILER, Profiler
+from progress import PROGRESS_FILE, is_completed, load_progress
+from roadmap import PHASES, get_active_milestones, get_current_phase, get_index
+from snapshot import DaySnapshot, iter_snapshots, take_snapshot
+from urgency import UrgencyRanker
 
 MOTIVATIONAL_CLOSERS = [
     "The 3.1 doesn't define you. The work does.",
@@ -56,7 +65,31 @@ MOTIVATIONAL_CLOSERS = [
     "Your brother's at the Naval Academy grinding. Match that energy.",
 ]
 
-ET = ZoneInfo("America/New_York")
+ET_NAME = "America/New_York"
+
+
+def now_et() -> datetime:
+    """Current time in US Eastern."""
+    from zoneinfo import ZoneInfo
+    return datetime.now(ZoneInfo(ET_NAME))
+
+
+def load_env() -> None:
+    """Load .env like python-dotenv's default lookup, but skip importing it when there's no file."""
+    d = SRC_DIR
+    while True:
+        if os.path.isfile(os.path.join(d, ".env")):
+            from dotenv import load_dotenv
+            load_dotenv(os.path.join(d, ".env"))
+            return
+        parent = os.path.dirname(d)
+        if parent == d:
+            return
+        d = parent
+
+
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
 
 
 def should_send_in_current_et_window(now_et: datetime) -> bool:
@@ -77,180 +110,362 @@ def get_closer(today: date) -> str:
 
 def get_overdue(today: date, progress: dict) -> list[dict]:
     """Milestones past their end date that aren't completed."""
-    overdue = []
-    for m in ROADMAP:
-        if is_completed(progress, m["id"]):
-            continue
-        end = m.get("deadline", m["end"])
-        if end < today:
-            overdue.append(m)
-    return overdue
+    return [m for m in get_index().due_before(today) if not is_completed(progress, m["id"])]
 
 
 def get_upcoming_deadlines(today: date, progress: dict, days: int = 7) -> list[dict]:
     """Milestones with deadlines in the next N days that aren't completed."""
-    upcoming = []
     window = today + timedelta(days=days)
-    for m in ROADMAP:
-        if is_completed(progress, m["id"]):
-            continue
-        deadline = m.get("deadline")
-        end = m["end"]
-        check_date = deadline if deadline else end
-        if today <= check_date <= window:
-            upcoming.append((m, check_date))
-    return [(m, d) for m, d in sorted(upcoming, key=lambda x: x[1])]
+    return [
+        (m, d) for m, d in get_index().due_between(today, window)
+        if not is_completed(progress, m["id"])
+    ]
 
 
 def get_top_focus(today: date, progress: dict, count: int = 3) -> list[str]:
-    """Get today's top focus tasks from active milestones with daily actions."""
-    active = get_active_milestones(today)
-    tasks = []
-    for m in active:
-        if is_completed(progress, m["id"]):
-            continue
-        if m.get("daily_action"):
-            tasks.append(m["daily_action"])
-    return tasks[:count]
+    """Get today's most urgent focus tasks from active milestones with daily actions."""
+    tasks = (
+        m for m in get_active_milestones(today)
+        if m.get("daily_action") and not is_completed(progress, m["id"])
+    )
+    return [m["daily_action"] for m in UrgencyRanker(progress).top(tasks, today, count)]
 
 
 def get_weekly_summary(today: date, progress: dict) -> str | None:
     """Monday-only: what was completed last week + this week's priorities."""
-    if today.weekday() != 0:  # 0 = Monday
+    return format_weekly_summary(take_snapshot(today, progress))
+
+
+def format_weekly_summary(snap: DaySnapshot) -> str | None:
+    """Render the Monday summary section from a snapshot."""
+    if snap.completed_last_week is None:
         return None
 
-    week_ago = today - timedelta(days=7)
     lines = []
 
     # Completions last week
-    completed_last_week = []
-    for m in ROADMAP:
-        entry = progress.get(m["id"], {})
-        cd = entry.get("completed_date")
-        if cd and week_ago.isoformat() <= cd <= today.isoformat():
-            completed_last_week.append(m["title"])
-
-    if completed_last_week:
+    if snap.completed_last_week:
         lines.append("LAST WEEK:")
-        for t in completed_last_week:
+        for t in snap.completed_last_week:
             lines.append(f"  + {t}")
     else:
         lines.append("LAST WEEK: No items completed")
 
     # This week's active priorities
-    active = get_active_milestones(today)
-    active_incomplete = [m for m in active if not is_completed(progress, m["id"])]
-    if active_incomplete:
+    if snap.active:
         lines.append("THIS WEEK:")
-        for m in active_incomplete[:5]:
+        for m in snap.active[:5]:
             lines.append(f"  > {m['title']}")
 
     return "\n".join(lines)
 
 
-def build_message(today: date) -> str:
-    """Build the full message for today."""
-    progress = load_progress()
+def format_message(snap: DaySnapshot, prof=NULL_PROFILER, at_risk: list | None = None) -> str:
+    """Render the full message from a day snapshot, plus (milestone, on-time odds) pairs at risk."""
+    today = snap.today
     parts = []
 
     # Weekly summary (Monday only)
-    weekly = get_weekly_summary(today, progress)
-    if weekly:
-        parts.append(weekly)
+    with prof.stage("section.weekly"):
+        weekly = format_weekly_summary(snap)
+        if weekly:
+            parts.append(weekly)
 
     # Top 3 focus tasks
-    focus = get_top_focus(today, progress)
-    if focus:
-        parts.append("")
-        parts.append("TODAY:")
-        for i, task in enumerate(focus, 1):
-            parts.append(f"  {i}. {task}")
+    with prof.stage("section.focus"):
+        focus = snap.top_focus(3)
+        if focus:
+            parts.append("")
+            parts.append("TODAY:")
+            for i, task in enumerate(focus, 1):
+                parts.append(f"  {i}. {task}")
 
     # Overdue
-    overdue = get_overdue(today, progress)
-    if overdue:
-        parts.append("")
-        parts.append(f"OVERDUE ({len(overdue)}):")
-        for m in overdue[:3]:
-            parts.append(f"  ! {m['title']}")
-        if len(overdue) > 3:
-            parts.append(f"  ...+{len(overdue) - 3} more")
+    with prof.stage("section.overdue"):
+        overdue = snap.overdue
+        if overdue:
+            parts.append("")
+            parts.append(f"OVERDUE ({len(overdue)}):")
+            for m in overdue[:3]:
+                parts.append(f"  ! {m['title']}")
+            if len(overdue) > 3:
+                parts.append(f"  ...+{len(overdue) - 3} more")
 
     # Upcoming deadlines
-    upcoming = get_upcoming_deadlines(today, progress)
-    if upcoming:
-        parts.append("")
-        parts.append("UPCOMING:")
-        for m, d in upcoming[:3]:
-            days_left = (d - today).days
-            parts.append(f"  {m['title']} ({days_left}d)")
+    with prof.stage("section.upcoming"):
+        upcoming = snap.upcoming
+        if upcoming:
+            parts.append("")
+            parts.append("UPCOMING:")
+            for m, d in upcoming[:3]:
+                days_left = (d - today).days
+                parts.append(f"  {m['title']} ({days_left}d)")
+
+    # At risk (REMINDER_FORECAST=1)
+    with prof.stage("section.at_risk"):
+        if at_risk:
+            parts.append("")
+            parts.append("AT RISK:")
+            for m, p in at_risk[:3]:
+                parts.append(f"  {m['title']} ({p:.0%} on time)")
 
     # Progress
-    completed, total = get_stats(progress)
-    pct = int((completed / total) * 100) if total > 0 else 0
-    parts.append("")
-    parts.append(f"PROGRESS: {completed}/{total} milestones ({pct}%)")
+    with prof.stage("section.progress"):
+        completed, total = snap.completed, snap.total
+        pct = int((completed / total) * 100) if total > 0 else 0
+        parts.append("")
+        parts.append(f"PROGRESS: {completed}/{total} milestones ({pct}%)")
 
     # Motivational closer
-    parts.append("")
-    parts.append(get_closer(today))
+    with prof.stage("section.closer"):
+        parts.append("")
+        parts.append(get_closer(today))
 
     return "\n".join(parts)
 
 
-def build_title(today: date) -> str:
-    """Build the notification title."""
+def _forecast_enabled() -> bool:
+    return os.getenv("REMINDER_FORECAST", "0") == "1"
+
+
+def _render_options() -> str:
+    """Settings besides roadmap and progress that change build_message's output."""
+    return f"forecast={int(_forecast_enabled())}"
+
+
+def build_message(today: date, prof=NULL_PROFILER, progress: dict | None = None) -> str:
+    """Build the full message for today, loading progress unless it's passed in."""
+    if progress is None:
+        with prof.stage("progress_load"):
+            progress = load_progress()
+    if prof.enabled and PROGRESS_FILE.exists():
+        prof.count("progress_file_bytes", PROGRESS_FILE.stat().st_size)
+    with prof.stage("snapshot"):
+        snap = take_snapshot(today, progress)
+    prof.count("milestones_scanned", snap.total)
+    risky = None
+    if _forecast_enabled():
+        with prof.stage("forecast"):
+            from forecast import at_risk, forecast  # needs numpy
+            risky = at_risk(forecast(today, progress), snap.active)
+    return format_message(snap, prof, risky)
+
+
+def build_title(today: date, phases: dict | None = None) -> str:
+    """Build the notification title, against PHASES unless another phase table is given."""
     day_name = today.strftime("%A")
     date_str = today.strftime("%m/%d")
-    phase_key = get_current_phase(today)
-    phase_label = PHASES[phase_key]["label"] if phase_key else "Off-schedule"
+    if phases is None:
+        phases = PHASES
+        phase_key = get_current_phase(today)
+    else:
+        phase_key = next((k for k, p in phases.items() if p["start"] <= today <= p["end"]), None)
+    phase_label = phases[phase_key]["label"] if phase_key else "Off-schedule"
     return f"{day_name} {date_str} | {phase_label}"
 
 
-def send_notification(title: str, message: str) -> None:
-    """Send push notification via Pushover."""
-    result = subprocess.run(
-        [
-            "curl", "-s", "-X", "POST",
-            "https://api.pushover.net/1/messages.json",
-            "-F", f"token={os.environ['PUSHOVER_API_TOKEN']}",
-            "-F", f"user={os.environ['PUSHOVER_USER_KEY']}",
-            "-F", f"title={title}",
-            "-F", f"message={message}",
-        ],
-        capture_output=True,
-        text=True,
-    )
-    response = json.loads(result.stdout)
-    if response.get("status") == 1:
-        print(f"Notification sent (request {response['request']})")
+def render_range(first: date, last: date, out, engine: str = "sweep", prof=NULL_PROFILER) -> int:
+    """Write one JSON line per day in [first, last] with its title and message.
+
+    engine "sweep" walks the dates incrementally; "numpy" evaluates blocks of dates with
+    vectorized comparisons over the compiled roadmap (needs numpy).
+    """
+    import json
+
+    with prof.stage("progress_load"):
+        progress = load_progress()
+    if engine == "numpy":
+        from compiled import compile_roadmap, date_range
+        snapshots = compile_roadmap().snapshots(date_range(first, last), progress)
     else:
-        print(f"Failed: {result.stdout}", file=sys.stderr)
+        snapshots = iter_snapshots(first, last, progress)
+    count = 0
+    with prof.stage("batch_render"):
+        for snap in snapshots:
+            record = {
+                "date": snap.today.isoformat(),
+                "title": build_title(snap.today),
+                "message": format_message(snap),
+            }
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    prof.count("days_rendered", count)
+    return count
+
+
+def deliver(recipients: list[str], title: str, message: str, prof=NULL_PROFILER) -> list:
+    """Send to each Pushover user key and print a masked result line per key.
+
+    Returns the DeliveryResult for each key.
+    """
+    with prof.stage("delivery"):
+        from delivery import PushoverClient
+
+        with PushoverClient(os.environ["PUSHOVER_API_TOKEN"]) as client:
+            results = client.send_many((user, title, message) for user in recipients)
+    prof.count("recipients", len(results))
+    prof.count("message_bytes", len(message.encode()))
+
+    for r in results:
+        who = f"{r.recipient[:4]}..."
+        if r.ok:
+            print(f"Notification sent to {who} (request {r.request_id})")
+        else:
+            print(f"Failed for {who} after {r.attempts} attempt(s): {r.error}", file=sys.stderr)
+    return results
+
+
+def _recipients() -> list[str]:
+    return [key.strip() for key in os.environ["PUSHOVER_USER_KEY"].split(",") if key.strip()]
+
+
+def send_notification(title: str, message: str, prof=NULL_PROFILER) -> None:
+    """Send push notification via Pushover to every key in PUSHOVER_USER_KEY (comma-separated)."""
+    if not all(r.ok for r in deliver(_recipients(), title, message, prof)):
         sys.exit(1)
 
 
+def send_once(today: date, force: bool = False, prof=NULL_PROFILER) -> None:
+    """Send today's reminder to each recipient that has no receipt for today yet.
+
+    Receipts are kept per (date, recipient) in render_cache, so a retry or a second cron
+    run sends only to whoever is still missing today's reminder, even if progress changed
+    in between. The rendered message is memoized on the roadmap and progress content and
+    the rendering options, so those runs don't re-render either. force resends to everyone.
+    """
+    from render_cache import RenderCache, content_hash
+
+    cache = RenderCache.load()
+    recipients = _recipients()
+    pending = recipients if force else [u for u in recipients if not cache.was_sent(today, u)]
+    if len(pending) < len(recipients):
+        print(f"Already sent today's reminder to {len(recipients) - len(pending)} recipient(s); skipping them")
+    if not pending:
+        return
+
+    with prof.stage("cache_lookup"):
+        content = content_hash(_render_options())
+        entry = cache.get(today, content)
+    prof.info["cache"] = "miss" if entry is None else "hit"
+    if entry is None:
+        with prof.stage("title"):
+            title = build_title(today)
+        entry = cache.put(today, content, title, build_message(today, prof))
+
+    results = deliver(pending, entry["title"], entry["message"], prof)
+    for r in results:
+        if r.ok:
+            cache.record(today, r.recipient, r.request_id)
+    cache.save()
+    if not all(r.ok for r in results):
+        sys.exit(1)
+
+
+def run_scheduler(schedule: str | None, dry_run: bool = False) -> None:
+    """Run the resident scheduler; with dry_run, print each message instead of sending it."""
+    from scheduler import run_daemon
+
+    def render(today: date, progress: dict) -> tuple[str, str]:
+        return build_title(today), build_message(today, progress=progress)
+
+    def print_only(recipients: list[str], title: str, message: str) -> list:
+        print(f"{title}\n{message}\n(dry run: not sent to {len(recipients)} recipient(s))", flush=True)
+        return []
+
+    if not dry_run:
+        os.environ["PUSHOVER_API_TOKEN"]  # fail at startup, not at the first send
+    run_daemon(schedule, render, print_only if dry_run else deliver)
+
+
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Daily quant roadmap reminder")
     parser.add_argument("--dry-run", action="store_true", help="Print message without sending")
     parser.add_argument("--date", type=str, help="Override date (YYYY-MM-DD) for testing")
+    parser.add_argument("--from", dest="date_from", type=str, help="Batch mode: first date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=str, help="Batch mode: last date (YYYY-MM-DD)")
+    parser.add_argument("--output", type=str, help="Batch mode: write JSON lines here instead of stdout")
+    parser.add_argument(
+        "--engine", choices=["sweep", "numpy"], default="sweep",
+        help="Batch mode: incremental sweep, or vectorized NumPy evaluation for very large roadmaps",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Send even to recipients who already got today's unchanged message",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="Stay resident and send at each recipient's scheduled local time (see scheduler.py)",
+    )
+    parser.add_argument("--schedule", type=str, help="Daemon mode: JSON file of recipients and send times")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Print per-stage timings as a JSON line on stderr (or set REMINDER_PROFILE=1)",
+    )
+    parser.add_argument(
+        "--profile-out", type=str,
+        help="Also write cProfile stats to this file (or set REMINDER_PROFILE_OUT)",
+    )
     args = parser.parse_args()
 
-    load_dotenv()
+    profile_out = args.profile_out or os.getenv("REMINDER_PROFILE_OUT")
+    if args.profile or profile_out or os.getenv("REMINDER_PROFILE", "0") == "1":
+        prof = Profiler(profile_out)
+    else:
+        prof = NULL_PROFILER
+    try:
+        _run(parser, args, prof)
+    finally:
+        prof.emit()
+
+
+def _run(parser: "argparse.ArgumentParser", args: "argparse.Namespace", prof) -> None:
+    with prof.stage("env"):
+        load_env()
+
+    if args.daemon:
+        run_scheduler(args.schedule, args.dry_run)
+        return
+
+    if args.date_from or args.date_to:
+        if not (args.date_from and args.date_to):
+            parser.error("--from and --to must be given together")
+        first = _parse_date(args.date_from)
+        last = _parse_date(args.date_to)
+        if first > last:
+            parser.error("--from must not be after --to")
+        prof.info["mode"] = "batch"
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as out:
+                count = render_range(first, last, out, args.engine, prof)
+            print(f"Rendered {count} days to {args.output}")
+        else:
+            render_range(first, last, sys.stdout, args.engine, prof)
+        return
 
     if args.date:
-        today = datetime.strptime(args.date, "%Y-%m-%d").date()
+        today = _parse_date(args.date)
     else:
-        now_et = datetime.now(ET)
-        if not should_send_in_current_et_window(now_et):
+        now = now_et()
+        if not should_send_in_current_et_window(now):
+            prof.info["mode"] = "skipped"
             print(
-                f"Skipping send (ET now {now_et.strftime('%H:%M')}, "
+                f"Skipping send (ET now {now.strftime('%H:%M')}, "
                 "outside configured ET send window)"
             )
             return
-        today = now_et.date()
+        today = now.date()
+    prof.info["date"] = today.isoformat()
+    prof.info["mode"] = "dry-run" if args.dry_run else "send"
+
+    if not args.dry_run and os.getenv("REMINDER_CACHE", "1") == "1":
+        send_once(today, args.force, prof)
+        return
 
-    title = build_title(today)
-    message = build_message(today)
+    with prof.stage("title"):
+        title = build_title(today)
+    message = build_message(today, prof)
 
     if args.dry_run:
         print("=" * 50)
@@ -259,7 +474,7 @@ def main():
         print(message)
         print("=" * 50)
     else:
-        send_notification(title, message)
+        send_notification(title, message, prof)
 
 
 if __name__ == "__main__":
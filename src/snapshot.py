@@ -0,0 +1,177 @@
+"""
+One-pass classification of the roadmap for a single day.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+from progress import CompletionIndex, Progress
+from roadmap import ROADMAP
+from urgency import UrgencyRanker
+
+_NO_ENTRY: dict = {}
+
+
+class DaySnapshot:
+    """Everything the daily message needs to know about one date.
+
+    A plain class rather than a dataclass: importing dataclasses costs more than the
+    whole daily render, and this module is on the reminder's cold path.
+    """
+
+    __slots__ = ("today", "active", "overdue", "upcoming", "completed_last_week", "completed", "total", "ranker")
+
+    def __init__(
+        self,
+        today: date,
+        active=None,
+        overdue=None,
+        upcoming: list[tuple[dict, date]] | None = None,
+        completed_last_week: list[str] | None = None,
+        completed: int = 0,
+        total: int = 0,
+        ranker: UrgencyRanker | None = None,
+    ):
+        self.today = today
+        # Any sequence of milestone dicts supporting len() and slicing will do for these two.
+        self.active = [] if active is None else active  # active and not completed, list order
+        self.overdue = [] if overdue is None else overdue  # past due and not completed, list order
+        self.upcoming = [] if upcoming is None else upcoming  # (milestone, due) within the window, by date
+        self.completed_last_week = completed_last_week  # titles; only filled in on Mondays
+        self.completed = completed
+        self.total = total
+        self.ranker = ranker  # ranks top_focus; None ranks without check-in history
+
+    def top_focus(self, count: int = 3) -> list[str]:
+        """The count most urgent daily actions among the active, incomplete milestones."""
+        ranker = self.ranker or UrgencyRanker({})
+        tasks = (m for m in self.active if m.get("daily_action"))
+        return [m["daily_action"] for m in ranker.top(tasks, self.today, count)]
+
+
+def take_snapshot(
+    today: date,
+    progress: dict,
+    milestones: list[dict] | None = None,
+    upcoming_days: int = 7,
+    ranker: UrgencyRanker | None = None,
+) -> DaySnapshot:
+    """Classify every milestone for today in a single pass over the roadmap."""
+    if milestones is None:
+        milestones = ROADMAP
+    snap = DaySnapshot(today=today, total=len(milestones), ranker=ranker or UrgencyRanker(progress))
+    window = today + timedelta(days=upcoming_days)
+
+    # Monday: last week's completions, from the completion index when progress keeps one.
+    monday = today.weekday() == 0
+    if monday and isinstance(progress, Progress) and milestones is ROADMAP:
+        monday = False
+        done = progress.completions.milestones_between(today - timedelta(days=7), today)
+        snap.completed_last_week = [m["title"] for m in done]
+    elif monday:
+        snap.completed_last_week = []
+        week_from = (today - timedelta(days=7)).isoformat()
+        week_to = today.isoformat()
+
+    active, overdue, upcoming = snap.active, snap.overdue, snap.upcoming
+    completed = 0
+    for m in milestones:
+        entry = progress.get(m["id"], _NO_ENTRY)
+        if monday:
+            cd = entry.get("completed_date")
+            if cd and week_from <= cd <= week_to:
+                snap.completed_last_week.append(m["title"])
+        if entry.get("completed", False):
+            completed += 1
+            continue
+        if m["start"] <= today <= m["end"]:
+            active.append(m)
+        due = m.get("deadline") or m["end"]
+        if due < today:
+            overdue.append(m)
+        elif due <= window:
+            upcoming.append((m, due))
+
+    snap.completed = completed
+    snap.upcoming.sort(key=lambda pair: pair[1])
+    return snap
+
+
+def iter_snapshots(
+    first: date,
+    last: date,
+    progress: dict,
+    milestones: list[dict] | None = None,
+    upcoming_days: int = 7,
+    ranker: UrgencyRanker | None = None,
+):
+    """Yield a DaySnapshot for every date from first to last inclusive.
+
+    Active and overdue sets are updated incrementally as the date advances rather than
+    reclassified from scratch each day. The yielded snapshots share their active/overdue
+    lists with the sweep, so consume each one before asking for the next.
+    """
+    if milestones is None:
+        milestones = ROADMAP
+    ranker = ranker or UrgencyRanker(progress, first=first, last=last)
+
+    completed = 0
+    pending = []  # positions of incomplete milestones
+    for i, m in enumerate(milestones):
+        if progress.get(m["id"], _NO_ENTRY).get("completed", False):
+            completed += 1
+        else:
+            pending.append(i)
+    completions = CompletionIndex(progress, milestones)  # for the Monday summaries
+
+    by_start = sorted(pending, key=lambda i: milestones[i]["start"])
+    by_end = sorted(pending, key=lambda i: milestones[i]["end"])
+    dues = sorted((milestones[i].get("deadline") or milestones[i]["end"], i) for i in pending)
+    due_dates = [d for d, _ in dues]
+    next_start = next_end = next_due = 0
+
+    active_pos, active = [], []
+    overdue_pos, overdue = [], []
+
+    today = first
+    while today <= last:
+        # Milestones that have started join the active set...
+        while next_start < len(by_start) and milestones[by_start[next_start]]["start"] <= today:
+            i = by_start[next_start]
+            next_start += 1
+            if milestones[i]["end"] >= today:
+                at = bisect_left(active_pos, i)
+                active_pos.insert(at, i)
+                active.insert(at, milestones[i])
+        # ...and ones whose end has passed leave it.
+        while next_end < len(by_end) and milestones[by_end[next_end]]["end"] < today:
+            i = by_end[next_end]
+            next_end += 1
+            at = bisect_left(active_pos, i)
+            if at < len(active_pos) and active_pos[at] == i:
+                del active_pos[at]
+                del active[at]
+        # Overdue only ever grows as the date advances.
+        while next_due < len(dues) and dues[next_due][0] < today:
+            i = dues[next_due][1]
+            next_due += 1
+            at = bisect_left(overdue_pos, i)
+            overdue_pos.insert(at, i)
+            overdue.insert(at, milestones[i])
+
+        window = today + timedelta(days=upcoming_days)
+        hi = bisect_right(due_dates, window)
+        snap = DaySnapshot(
+            today=today,
+            active=active,
+            overdue=overdue,
+            upcoming=[(milestones[i], d) for d, i in dues[next_due:hi]],
+            completed=completed,
+            total=len(milestones),
+            ranker=ranker,
+        )
+        if today.weekday() == 0:
+            done = completions.milestones_between(today - timedelta(days=7), today)
+            snap.completed_last_week = [m["title"] for m in done]
+        yield snap
+        today += timedelta(days=1)
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Local sync service for the dashboard: buffers check-ins and writes them in batches.
+
+The page POSTs each toggle as a small operation instead of committing the whole file.
+Operations that arrive within the debounce window are coalesced into one write, which
+is applied with compare-and-swap on the progress content hash. If the file changed
+underneath (another device, a git pull, the GitHub contents API), the batch is
+re-applied to the fresh copy and retried. Operations are intents ("check calc3 on
+2026-10-17"), not file snapshots, so re-applying them merges cleanly.
+
+Endpoints (JSON):
+    GET  /progress[?since=YYYY-MM-DD]
+                            current milestone state and the daily_log from since on (default:
+                            the last RECENT_LOG_DAYS days in ET), with queued operations applied,
+                            plus the store's version. Older history comes from the bundle.
+    POST /ops[?wait=1]      {"ops": [{"op": "check", "id": "calc3", "day": "2026-10-17"}, ...]}
+                            op is check, uncheck, complete or uncomplete; day defaults to
+                            today in ET, as the reminder counts days. With wait=1 the
+                            reply is sent once the batch holding these ops is written.
+    POST /flush             write whatever is queued now
+
+By default it writes the local progress store (PROGRESS_BACKEND applies). With --github
+it commits data/progress.json through the GitHub contents API instead, using the blob
+sha as the compare-and-swap version; set GITHUB_TOKEN.
+
+Usage:
+    python src/sync_server.py [--port 8765] [--debounce 0.5] [--github jeffyeats/gsd-quant-roadmap]
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from bundle import RECENT_LOG_DAYS
+from progress import load_progress, progress_hash, progress_lock, save_progress, set_completed
+from roadmap import ROADMAP
+from send_reminder import now_et
+
+OPS = ("check", "uncheck", "complete", "uncomplete")
+DEFAULT_ORIGINS = "https://jeffyeats.github.io,http://localhost:8000,http://127.0.0.1:8000"
+
+
+class Conflict(Exception):
+    """The stored progress changed since it was read."""
+
+
+def validate_ops(ops) -> list[dict]:
+    """Check a client's operation list; raises ValueError naming the first bad entry."""
+    if not isinstance(ops, list) or not ops:
+        raise ValueError("expected a non-empty 'ops' list")
+    known = {m["id"] for m in ROADMAP}
+    clean = []
+    for op in ops:
+        if not isinstance(op, dict) or op.get("op") not in OPS:
+            raise ValueError(f"bad op: {op!r}")
+        if op.get("id") not in known:
+            raise ValueError(f"unknown milestone: {op.get('id')!r}")
+        try:
+            day = date.fromisoformat(op.get("day") or now_et().date().isoformat())
+        except (TypeError, ValueError):
+            raise ValueError(f"bad day: {op.get('day')!r}") from None
+        clean.append({"op": op["op"], "id": op["id"], "day": day.isoformat()})
+    return clean
+
+
+def apply_ops(progress: dict, ops: list[dict]) -> None:
+    """Apply operations in order. Each is idempotent, so re-applying after a conflict is safe."""
+    log = progress.setdefault("daily_log", {})
+    for op in ops:
+        kind, milestone_id, day = op["op"], op["id"], op["day"]
+        if kind == "check":
+            entries = log.setdefault(day, [])
+            if milestone_id not in entries:
+                entries.append(milestone_id)
+        elif kind == "uncheck":
+            entries = log.get(day)
+            if entries and milestone_id in entries:
+                entries.remove(milestone_id)
+        else:
+            set_completed(progress, milestone_id, kind == "complete", date.fromisoformat(day))
+
+
+def recent_log(log, since: date) -> dict:
+    """The check-ins on or after since, as a plain dict."""
+    if hasattr(log, "between"):  # month-sharded log: load only the months from since on
+        return log.between(since, date.max)
+    lo = since.isoformat()
+    return {day: ids for day, ids in ({} if log is None else log).items() if day >= lo}
+
+
+def describe(ops: list[dict]) -> str:
+    """Commit message for a batch."""
+    parts = [f"{op['op']} {op['id']} ({op['day']})" for op in ops[:5]]
+    if len(ops) > 5:
+        parts.append(f"+{len(ops) - 5} more")
+    return f"Sync {len(ops)} change{'s' if len(ops) != 1 else ''}: " + ", ".join(parts)
+
+
+class LocalStore:
+    """The configured local progress store, versioned by progress_hash()."""
+
+    def read(self) -> tuple[dict, str]:
+        version = progress_hash()
+        return load_progress(), version
+
+    def write(self, progress: dict, version: str, message: str) -> str:
+        with progress_lock():
+            if progress_hash() != version:
+                raise Conflict("progress changed since it was read")
+            save_progress(progress)
+            return progress_hash()
+
+
+class GitHubStore:
+    """data/progress.json in a GitHub repo, versioned by its blob sha."""
+
+    def __init__(self, repo: str, token: str, path: str = "data/progress.json", branch: str = "main"):
+        self.url = f"https://api.github.com/repos/{repo}/contents/{path}"
+        self.token = token
+        self.branch = branch
+
+    def _request(self, method: str, body: dict | None = None) -> dict:
+        url = self.url if body else f"{self.url}?ref={self.branch}"
+        req = urllib.request.Request(url, method=method, data=json.dumps(body).encode() if body else None)
+        req.add_header("Authorization", f"Bearer {self.token}")
+        req.add_header("Accept", "application/vnd.github.v3+json")
+        try:
+            with urllib.request.urlopen(req, timeout=20) as res:
+                return json.load(res)
+        except urllib.error.HTTPError as e:
+            if e.code in (409, 422):  # the sha we sent is no longer the file's
+                raise Conflict(e.reason) from None
+            raise
+
+    def read(self) -> tuple[dict, str]:
+        data = self._request("GET")
+        return json.loads(base64.b64decode(data["content"])), data["sha"]
+
+    def write(self, progress: dict, version: str, message: str) -> str:
+        content = json.dumps(progress, separators=(",", ":")) + "\n"
+        data = self._request("PUT", {
+            "message": message,
+            "content": base64.b64encode(content.encode()).decode(),
+            "sha": version,
+            "branch": self.branch,
+        })
+        return data["content"]["sha"]
+
+
+def commit(store, ops: list[dict], attempts: int = 5) -> str:
+    """Read, apply, compare-and-swap; on conflict re-read and re-apply. Returns the new version."""
+    for _ in range(attempts):
+        progress, version = store.read()
+        apply_ops(progress, ops)
+        try:
+            return store.write(progress, version, describe(ops))
+        except Conflict:
+            continue
+    raise Conflict(f"progress kept changing; gave up after {attempts} attempts")
+
+
+class SyncQueue:
+    """Buffers operations and writes them as one batch per debounce window.
+
+    A batch is written once no new operation has arrived for `debounce` seconds, or
+    `max_delay` seconds after its first operation, whichever comes first.
+    """
+
+    def __init__(self, store, debounce: float = 0.5, max_delay: float = 2.0):
+        self.store = store
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()  # one write at a time
+        self._pending: list[dict] = []
+        self._batch = 0  # id of the batch now collecting operations
+        self._results: dict[int, tuple[bool, str]] = {}  # batch id -> (ok, version or error)
+        self._first_at: float | None = None
+        self._timer: threading.Timer | None = None
+
+    def submit(self, ops: list[dict]) -> int:
+        """Queue operations; returns the id of the batch they'll be written in."""
+        with self._cond:
+            self._pending.extend(ops)
+            now = time.monotonic()
+            if self._first_at is None:
+                self._first_at = now
+            if self._timer is not None:
+                self._timer.cancel()
+            delay = max(0.0, min(self.debounce, self._first_at + self.max_delay - now))
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+            return self._batch
+
+    def pending(self) -> list[dict]:
+        with self._cond:
+            return list(self._pending)
+
+    def wait(self, batch: int, timeout: float = 30.0) -> tuple[bool, str]:
+        with self._cond:
+            if not self._cond.wait_for(lambda: batch in self._results, timeout):
+                return False, "timed out waiting for the write"
+            return self._results[batch]
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._cond:
+                ops, self._pending = self._pending, []
+                batch = self._batch
+                self._batch += 1
+                self._first_at = None
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not ops:
+                result = (True, "")
+            else:
+                try:
+                    result = (True, commit(self.store, ops))
+                    print(f"Wrote {len(ops)} op(s) as one update", flush=True)
+                except Exception as e:  # reported to every waiter on this batch
+                    result = (False, f"{type(e).__name__}: {e}")
+                    print(f"Write failed: {result[1]}", file=sys.stderr, flush=True)
+            with self._cond:
+                self._results[batch] = result
+                self._results.pop(batch - 100, None)  # waiters are long gone by then
+                self._cond.notify_all()
+
+
+class SyncHandler(BaseHTTPRequestHandler):
+    queue: SyncQueue
+    origins: set[str]
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self._cors()
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _cors(self) -> None:
+        origin = self.headers.get("Origin")
+        if origin in self.origins:
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Vary", "Origin")
+
+    def _allowed(self) -> bool:
+        # Browsers always send Origin on cross-site POSTs; tools like curl send none.
+        origin = self.headers.get("Origin")
+        if origin is not None and origin not in self.origins:
+            self._send(403, {"error": f"origin {origin} not allowed"})
+            return False
+        return True
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors()
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Private-Network", "true")  # public page -> localhost
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if not self._allowed():
+            return
+        url = urlsplit(self.path)
+        if url.path != "/progress":
+            return self._send(404, {"error": "not found"})
+        try:
+            since = parse_qs(url.query).get("since", [""])[0]
+            since = date.fromisoformat(since) if since else now_et().date() - timedelta(days=RECENT_LOG_DAYS)
+        except ValueError:
+            return self._send(400, {"error": f"bad since: {since!r}"})
+        progress, version = self.queue.store.read()
+        progress["daily_log"] = recent_log(progress.get("daily_log"), since)
+        pending = self.queue.pending()
+        apply_ops(progress, pending)
+        self._send(200, {"progress": progress, "version": version, "pending": len(pending)})
+
+    def do_POST(self):
+        if not self._allowed():
+            return
+        url = urlsplit(self.path)
+        if url.path == "/flush":
+            self.queue.flush()
+            return self._send(200, {"ok": True})
+        if url.path != "/ops":
+            return self._send(404, {"error": "not found"})
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            ops = validate_ops(body.get("ops"))
+        except (ValueError, AttributeError) as e:
+            return self._send(400, {"error": str(e)})
+        batch = self.queue.submit(ops)
+        if parse_qs(url.query).get("wait") != ["1"]:
+            return self._send(202, {"queued": len(ops)})
+        ok, detail = self.queue.wait(batch)
+        if ok:
+            self._send(200, {"version": detail})
+        else:
+            self._send(409 if detail.startswith("Conflict") else 502, {"error": detail})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local sync service for dashboard check-ins")
+    parser.add_argument("--port", type=int, default=int(os.getenv("SYNC_PORT", "8765")))
+    parser.add_argument("--debounce", type=float, default=0.5, help="Seconds of quiet before a batch is written")
+    parser.add_argument("--max-delay", type=float, default=2.0, help="Longest a queued op waits to be written")
+    parser.add_argument("--github", metavar="OWNER/REPO", help="Commit through the GitHub contents API (needs GITHUB_TOKEN)")
+    parser.add_argument("--branch", default="main")
+    args = parser.parse_args()
+
+    if args.github:
+        store = GitHubStore(args.github, os.environ["GITHUB_TOKEN"], branch=args.branch)
+    else:
+        store = LocalStore()
+    SyncHandler.queue = SyncQueue(store, args.debounce, args.max_delay)
+    SyncHandler.origins = {o.strip() for o in os.getenv("SYNC_ALLOW_ORIGINS", DEFAULT_ORIGINS).split(",") if o.strip()}
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), SyncHandler)
+    print(f"Sync service on http://127.0.0.1:{args.port} ({'GitHub ' + args.github if args.github else 'local store'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        SyncHandler.queue.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Render the morning reminder for a whole cohort, one roadmap and progress file per user.
+
+Users come from a manifest file:
+
+    {"roadmap": "roadmaps/quant.json",
+     "users": [
+        {"id": "alice", "progress": "alice/progress.json"},
+        {"id": "bob", "progress": "bob/progress.json", "roadmap": "roadmaps/econ.json"}
+     ]}
+
+or from a directory holding one <user>/progress.json per user, where <user>/roadmap.json,
+then <dir>/roadmap.json, override the default roadmap. Relative paths are resolved
+against the manifest's directory. A missing progress file means nothing is done yet.
+
+Rendering fans out over a process pool. Each worker loads every distinct roadmap once,
+in its initializer, so per-user work is just reading that user's progress, one snapshot
+and one format.
+
+Usage:
+    python src/tenants.py cohort/                          # JSON lines on stdout
+    python src/tenants.py cohort.json --date 2026-10-19 --workers 8 --output out.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from roadmap import ROADMAP_FILE, load_roadmap
+from send_reminder import build_title, format_message, now_et
+from snapshot import take_snapshot
+from urgency import UrgencyRanker
+
+
+@dataclass(frozen=True)
+class Tenant:
+    id: str
+    progress: Path
+    roadmap: Path
+
+
+def load_manifest(path: str | Path) -> list[Tenant]:
+    """Read the users from a manifest file or a directory of per-user folders."""
+    path = Path(path).resolve()
+    if path.is_dir():
+        shared = path / "roadmap.json"
+        default = shared if shared.exists() else ROADMAP_FILE
+        tenants = []
+        for user_dir in sorted(p for p in path.iterdir() if p.is_dir()):
+            if not (user_dir / "progress.json").exists():
+                continue
+            own = user_dir / "roadmap.json"
+            tenants.append(Tenant(user_dir.name, user_dir / "progress.json", own if own.exists() else default))
+        return tenants
+
+    with open(path) as f:
+        manifest = json.load(f)
+    base = path.parent
+    default = base / manifest["roadmap"] if "roadmap" in manifest else ROADMAP_FILE
+    tenants, seen = [], set()
+    for user in manifest["users"]:
+        if user["id"] in seen:
+            raise ValueError(f"{path}: duplicate user id {user['id']!r}")
+        seen.add(user["id"])
+        roadmap = base / user["roadmap"] if "roadmap" in user else default
+        tenants.append(Tenant(user["id"], base / user["progress"], roadmap.resolve()))
+    return tenants
+
+
+# Per-worker: roadmap path -> (milestones, phases), filled in once by _init_worker.
+_roadmaps: dict[str, tuple[list[dict], dict]] = {}
+
+
+def _init_worker(roadmap_paths: list[str]) -> None:
+    for p in roadmap_paths:
+        _roadmaps[p] = load_roadmap(p)
+
+
+def _render_one(job: tuple[str, str, str, date]) -> tuple[str, str | None, str | None, str | None]:
+    """Return (user id, title, message, error) for one user."""
+    user_id, roadmap_path, progress_path, today = job
+    try:
+        try:
+            with open(progress_path) as f:
+                progress = json.load(f)
+        except FileNotFoundError:
+            progress = {}
+        milestones, phases = _roadmaps[roadmap_path]
+        snap = take_snapshot(today, progress, milestones, ranker=UrgencyRanker(progress, phases))
+        return user_id, build_title(today, phases), format_message(snap), None
+    except Exception as e:  # one bad progress file shouldn't sink the cohort
+        return user_id, None, None, f"{type(e).__name__}: {e}"
+
+
+def render_all(tenants: list[Tenant], today: date, workers: int | None = None):
+    """Yield (user id, title, message, error) for every tenant, in manifest order."""
+    roadmap_paths = sorted({str(t.roadmap) for t in tenants})
+    # Validate (and compile-cache) each roadmap here, so a bad file fails fast and the
+    # workers all find a warm cache instead of racing to build it.
+    for p in roadmap_paths:
+        load_roadmap(p)
+    jobs = [(t.id, str(t.roadmap), str(t.progress), today) for t in tenants]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        _init_worker(roadmap_paths)
+        yield from map(_render_one, jobs)
+        return
+    # A few chunks per worker keeps IPC overhead low while still balancing the load.
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(roadmap_paths,)) as pool:
+        yield from pool.map(_render_one, jobs, chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render reminders for every user in a manifest")
+    parser.add_argument("manifest", help="Manifest JSON file, or a directory of <user>/progress.json")
+    parser.add_argument("--date", type=str, help="Render for this date (YYYY-MM-DD); default today in ET")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--output", type=str, help="Write JSON lines here instead of stdout")
+    args = parser.parse_args()
+
+    today = date.fromisoformat(args.date) if args.date else now_et().date()
+    tenants = load_manifest(args.manifest)
+    started = time.perf_counter()
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    try:
+        for user_id, title, message, error in render_all(tenants, today, args.workers):
+            if error:
+                failed += 1
+                print(f"{user_id}: {error}", file=sys.stderr)
+                continue
+            record = {"user": user_id, "date": today.isoformat(), "title": title, "message": message}
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - started
+    print(f"Rendered {len(tenants) - failed}/{len(tenants)} users in {elapsed:.2f}s", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
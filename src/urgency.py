@@ -0,0 +1,97 @@
+"""
+Urgency ranking for the TODAY list: which active daily actions matter most right now.
+
+A milestone's urgency key, smallest first:
+    1. days until it's due (deadline, else end), minus how long it has been neglected:
+       the days since its last daily_log check-in (or since it started, if never
+       checked), capped at NEGLECT_CAP so neglect can't outweigh a real deadline
+    2. its phase's position in PHASES, so earlier phases' leftovers come first
+    3. its roadmap position, so ties keep list order
+
+Since neglect is capped, only check-ins from the last NEGLECT_CAP days before a ranked
+date matter, and only those are read. A month-sharded daily_log therefore loads just
+the shards that window touches.
+"""
+
+import heapq
+from bisect import bisect_right
+from datetime import date
+
+from roadmap import PHASES
+
+NEGLECT_CAP = 14
+
+
+class UrgencyRanker:
+    """Ranks milestones for one progress dict.
+
+    The per-milestone check-in index covers [first - NEGLECT_CAP, last]. It is read from
+    daily_log on first use and then shared by every day ranked in that range, so one
+    ranker serves a whole batch render. Ranking a day outside the range widens it.
+    """
+
+    def __init__(self, progress: dict, phases: dict | None = None,
+                 first: date | None = None, last: date | None = None):
+        log = progress.get("daily_log")
+        self._log = {} if log is None else log
+        self._phase_rank = {key: i for i, key in enumerate(PHASES if phases is None else phases)}
+        self._span = (first, last or first) if first else None
+        self._covered: tuple[int, int] | None = None  # ordinals the index was built for
+        self._checkins: dict[str, list[int]] = {}
+
+    def _index(self, today: date) -> dict[str, list[int]]:
+        t = today.toordinal()
+        if self._covered is None or not self._covered[0] <= t <= self._covered[1]:
+            lo, hi = t, t
+            if self._covered is not None:
+                lo, hi = min(lo, self._covered[0]), max(hi, self._covered[1])
+            elif self._span is not None:
+                lo, hi = min(lo, self._span[0].toordinal()), max(hi, self._span[1].toordinal())
+            self._checkins = self._read(date.fromordinal(lo - NEGLECT_CAP), date.fromordinal(hi))
+            self._covered = (lo, hi)
+        return self._checkins
+
+    def _read(self, first: date, last: date) -> dict[str, list[int]]:
+        """Sorted check-in ordinals per milestone for days in [first, last]."""
+        if hasattr(self._log, "between"):  # month-sharded log: load only the overlapping months
+            days = self._log.between(first, last).items()
+        else:
+            keys = (date.fromordinal(n).isoformat() for n in range(first.toordinal(), last.toordinal() + 1))
+            days = ((day, self._log.get(day)) for day in keys)
+        checkins: dict[str, list[int]] = {}
+        for day, ids in days:
+            if ids:
+                ordinal = date.fromisoformat(day).toordinal()
+                for milestone_id in ids:
+                    checkins.setdefault(milestone_id, []).append(ordinal)
+        for ordinals in checkins.values():
+            ordinals.sort()
+        return checkins
+
+    def last_checkin(self, milestone_id: str, today: date) -> date | None:
+        """The latest check-in for milestone_id on or before today, within NEGLECT_CAP days."""
+        ordinals = self._index(today).get(milestone_id)
+        if ordinals:
+            t = today.toordinal()
+            at = bisect_right(ordinals, t)
+            if at and ordinals[at - 1] >= t - NEGLECT_CAP:
+                return date.fromordinal(ordinals[at - 1])
+        return None
+
+    def top(self, milestones, today: date, count: int = 3) -> list[dict]:
+        """The count most urgent of milestones, in O(n log count)."""
+        index = self._index(today)
+        t = today.toordinal()
+        unranked = len(self._phase_rank)
+
+        def key(m: dict) -> tuple[int, int]:
+            ordinals = index.get(m["id"])
+            at = bisect_right(ordinals, t) if ordinals else 0
+            # Older check-ins are read only when a wider batch window holds them; ignore
+            # them so a day ranks the same whichever window it's rendered in.
+            last = ordinals[at - 1] if at and ordinals[at - 1] >= t - NEGLECT_CAP else m["start"].toordinal()
+            days_left = (m.get("deadline") or m["end"]).toordinal() - t
+            return days_left - min(t - last, NEGLECT_CAP), self._phase_rank.get(m["phase"], unranked)
+
+        # nsmallest is stable, so candidates with equal keys keep their (list) order.
+        return heapq.nsmallest(count, milestones, key=key)
@@ -0,0 +1,54 @@
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import analytics
+import progress
+import progress_shards
+import render_cache
+import roadmap
+from roadmap import ROADMAP
+
+try:
+    import forecast
+except ImportError:  # needs numpy
+    forecast = None
+
+
+def history(first: date, last: date) -> dict:
+    """A daily_log with one check-in per day, rotating through the roadmap."""
+    log = {}
+    day = first
+    while day <= last:
+        log[day.isoformat()] = [ROADMAP[day.toordinal() % len(ROADMAP)]["id"]]
+        day += timedelta(days=1)
+    return log
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Point every data/.cache writer at tmp_path, so tests leave the checkout alone."""
+    cache = tmp_path / ".cache"
+    monkeypatch.setattr(roadmap, "CACHE_DIR", cache)
+    monkeypatch.setattr(analytics, "CACHE_FILE", cache / "analytics-days.json")
+    monkeypatch.setattr(render_cache, "CACHE_FILE", cache / "reminders.json")
+    if forecast is not None:
+        monkeypatch.setattr(forecast, "CACHE_FILE", cache / "forecast.json")
+
+
+@pytest.fixture
+def sharded_store(tmp_path, monkeypatch):
+    """PROGRESS_BACKEND=sharded in a temp dir, seeded with 2025-01-01..2026-10-17 of check-ins."""
+    monkeypatch.setenv("PROGRESS_BACKEND", "sharded")
+    monkeypatch.setattr(progress, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(progress, "PROGRESS_FILE", tmp_path / "progress.json")
+    monkeypatch.setattr(progress, "LOCK_FILE", tmp_path / ".progress.lock")
+    monkeypatch.setattr(progress_shards, "PROGRESS_FILE", tmp_path / "progress.json")
+    monkeypatch.setattr(progress_shards, "SHARD_DIR", tmp_path / "progress")
+    log = history(date(2025, 1, 1), date(2026, 10, 17))
+    progress.save_progress({**{m["id"]: {"completed": False, "completed_date": None} for m in ROADMAP}, "daily_log": log})
+    return log
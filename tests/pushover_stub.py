@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+A local stand-in for the Pushover messages API, for exercising delivery.py.
+
+Responses are scripted: each request takes the next (status, headers, body) from the
+queue, and answers 200 {"status": 1} once the queue is empty. The stub keeps HTTP/1.1
+connections alive and counts them, so tests can check connection reuse.
+
+Usage:
+    python tests/pushover_stub.py [--port 8099]
+    PUSHOVER_API_URL=http://127.0.0.1:8099/1/messages.json python src/send_reminder.py
+"""
+
+import argparse
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server: "PushoverStub"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        fields = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode()).items()}
+        with self.server.lock:
+            self.server.requests.append(fields)
+            status, headers, body = self.server.script.popleft() if self.server.script else (200, {}, None)
+            count = len(self.server.requests)
+        if body is None:
+            body = {"status": 1, "request": f"req-{count}"} if status == 200 else {"status": 0}
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class PushoverStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.lock = threading.Lock()
+        self.script: deque = deque()
+        self.requests: list[dict] = []
+        self.connections = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/1/messages.json"
+
+    def respond(self, status: int, headers: dict | None = None, body=None) -> None:
+        """Queue the response for a coming request; body is JSON-encoded unless it's bytes."""
+        self.script.append((status, headers or {}, body))
+
+    def start(self) -> "PushoverStub":
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Pushover API")
+    parser.add_argument("--port", type=int, default=8099)
+    args = parser.parse_args()
+    stub = PushoverStub(args.port)
+    print(f"Pushover stand-in on {stub.url}")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from delivery import PushoverClient
+from pushover_stub import PushoverStub
+
+
+@pytest.fixture
+def stub():
+    server = PushoverStub().start()
+    yield server
+    server.stop()
+
+
+def _client(stub, **kwargs) -> PushoverClient:
+    return PushoverClient("token", url=stub.url, backoff=0.01, **kwargs)
+
+
+def test_delivers(stub):
+    with _client(stub) as client:
+        result = client.send("user-a", "Title", "Body")
+    assert result.ok and result.attempts == 1 and result.request_id == "req-1"
+    assert stub.requests[0] == {"token": "token", "user": "user-a", "title": "Title", "message": "Body"}
+
+
+def test_429_retry_after_seconds(stub):
+    stub.respond(429, {"Retry-After": "0.3"})
+    started = time.monotonic()
+    with _client(stub) as client:
+        result = client.send("user-a", "T", "M")
+    assert result.ok and result.attempts == 2
+    assert time.monotonic() - started >= 0.3
+
+
+def test_429_retry_after_http_date(stub):
+    until = datetime.now(timezone.utc) + timedelta(seconds=2)
+    stub.respond(429, {"Retry-After": format_datetime(until, usegmt=True)})
+    started = time.monotonic()
+    with _client(stub) as client:
+        result = client.send("user-a", "T", "M")
+    assert result.ok and result.attempts == 2
+    assert time.monotonic() - started >= 0.9  # HTTP-dates have one-second resolution
+
+
+def test_429_unreadable_retry_after_backs_off(stub):
+    stub.respond(429, {"Retry-After": "soon"})
+    with _client(stub) as client:
+        result = client.send("user-a", "T", "M")
+    assert result.ok and result.attempts == 2
+
+
+def test_5xx_retried(stub):
+    stub.respond(503)
+    stub.respond(502)
+    with _client(stub) as client:
+        result = client.send("user-a", "T", "M")
+    assert result.ok and result.attempts == 3
+
+
+def test_5xx_gives_up(stub):
+    for _ in range(3):
+        stub.respond(500)
+    with _client(stub, retries=2) as client:
+        result = client.send("user-a", "T", "M")
+    assert not result.ok and result.attempts == 3 and result.status == 500
+
+
+def test_4xx_not_retried(stub):
+    stub.respond(400, body={"status": 0, "errors": ["user identifier is invalid"]})
+    with _client(stub) as client:
+        result = client.send("user-a", "T", "M")
+    assert not result.ok and result.attempts == 1 and result.error == "user identifier is invalid"
+
+
+def test_connection_reused(stub):
+    with _client(stub) as client:
+        results = [client.send(f"user-{i}", "T", "M") for i in range(5)]
+    assert all(r.ok for r in results)
+    assert stub.connections == 1
+
+
+def test_unexpected_error_fails_one_recipient(stub):
+    stub.respond(200, body=[1])  # not an object: payload.get raises
+    with _client(stub, workers=1) as client:
+        results = client.send_many([("bad", "T", "M"), ("good", "T", "M")])
+    assert [r.recipient for r in results] == ["bad", "good"]
+    assert not results[0].ok and "AttributeError" in results[0].error
+    assert results[1].ok
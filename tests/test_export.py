@@ -0,0 +1,26 @@
+import json
+from datetime import date
+
+from export import iter_cohort
+from roadmap import ROADMAP_FILE
+
+LAST = date(2027, 1, 31)
+
+
+def test_cohort_starts_at_each_users_roadmap(tmp_path):
+    data = json.loads(ROADMAP_FILE.read_text())
+    late = {**data, "milestones": [m for m in data["milestones"] if m["start"] >= "2026-09-01"]}
+    (tmp_path / "late.json").write_text(json.dumps(late))
+    (tmp_path / "manifest.json").write_text(json.dumps({"users": [
+        {"id": "early", "progress": "early.json"},
+        {"id": "late", "progress": "late-progress.json", "roadmap": "late.json"},
+    ]}))
+
+    first = {}
+    for row in iter_cohort(str(tmp_path / "manifest.json"), None, LAST):
+        first.setdefault(row[0], row[1])
+    assert first["early"] == min(m["start"] for m in data["milestones"])
+    assert first["late"] == min(m["start"] for m in late["milestones"])
+
+    rows = list(iter_cohort(str(tmp_path / "manifest.json"), date(2026, 12, 1), LAST))
+    assert min(r[1] for r in rows if r[0] == "late") == "2026-12-01"
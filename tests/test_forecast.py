@@ -0,0 +1,58 @@
+import math
+import random
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import forecast
+from forecast import HORIZON_DAYS, TARGET_PACE, simulate
+
+TODAY = date(2026, 10, 17)
+
+
+def _roadmap(count: int, start: date, end: date) -> tuple[list[dict], dict]:
+    milestones = [
+        {"id": f"m{i}", "phase": "p", "title": f"M{i}", "daily_action": "work", "start": start, "end": end}
+        for i in range(count)
+    ]
+    return milestones, {"p": {"label": "P", "start": start, "end": end}}
+
+
+def test_calibrated_on_pace(monkeypatch):
+    """Milestones checked in at the target pace: predicted odds match how many actually finish."""
+    monkeypatch.setattr(forecast, "CHUNK_CELLS", 100_000)  # several chunks
+    rnd = random.Random(7)
+    start, end = TODAY - timedelta(days=30), TODAY + timedelta(days=29)
+    milestones, phases = _roadmap(300, start, end)
+    target = math.ceil(TARGET_PACE * 60)
+    rate = 0.72
+
+    log, finished = {}, 0
+    for m in milestones:
+        day, hits = start, 0
+        while day <= end:
+            if rnd.random() < rate:
+                hits += 1
+                if day < TODAY:
+                    log.setdefault(day.isoformat(), []).append(m["id"])
+            day += timedelta(days=1)
+        finished += hits >= target
+    progress = {**{m["id"]: {"completed": False} for m in milestones}, "daily_log": log}
+
+    result = simulate(progress, TODAY, milestones, phases, paths=4000, seed=1)
+    predicted = np.mean([f["p_on_time"] for f in result["milestones"].values()])
+    assert abs(predicted - finished / len(milestones)) < 0.1
+    expected = sorted(date.fromisoformat(f["expected"]) for f in result["milestones"].values())
+    assert abs((expected[len(expected) // 2] - end).days) <= 7
+
+
+def test_stalled_milestone_clamped_to_horizon():
+    milestones, phases = _roadmap(1, TODAY - timedelta(days=200), TODAY + timedelta(days=100))
+    progress = {"m0": {"completed": False}, "daily_log": {}}
+    result = simulate(progress, TODAY, milestones, phases, paths=1000, seed=1)
+    horizon = (TODAY + timedelta(days=100 + HORIZON_DAYS)).isoformat()
+    assert result["milestones"]["m0"] == {"phase": "p", "due": milestones[0]["end"].isoformat(),
+                                          "expected": horizon, "p_on_time": 0.0}
+    assert result["phases"]["p"]["expected"] == horizon
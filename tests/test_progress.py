@@ -0,0 +1,94 @@
+from datetime import date
+
+import pytest
+
+import progress as progress_module
+import progress_log
+from progress import Progress, ProgressStats, completion_index, get_stats
+from roadmap import ROADMAP
+
+DONE = {"completed": True, "completed_date": "2026-10-01"}
+
+
+def _progress() -> Progress:
+    progress = Progress({m["id"]: {"completed": False, "completed_date": None} for m in ROADMAP})
+    get_stats(progress)
+    completion_index(progress)
+    return progress
+
+
+def _check(progress: Progress) -> None:
+    fresh = ProgressStats(progress)
+    assert progress.stats.completed == fresh.completed and progress.stats.phases == fresh.phases
+    expected = sorted(k for k, v in progress.items() if v and v.get("completed"))
+    found = completion_index(progress).milestones_between(date(2026, 1, 1), date(2026, 12, 31))
+    assert sorted(m["id"] for m in found) == expected
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda p, a, b: p.update({a: DONE}, **{b: DONE}),
+    lambda p, a, b: p.__ior__({a: DONE, b: DONE}),
+    lambda p, a, b: (p.pop(a), p.setdefault(a, DONE)),
+    lambda p, a, b: (p.update({a: DONE, b: DONE}), p.pop(b), p.pop("missing", None)),
+    lambda p, a, b: (p.update({a: DONE}), p.popitem()),
+    lambda p, a, b: (p.update({a: DONE}), p.clear(), p.update({b: DONE})),
+])
+def test_dict_methods_keep_counters(mutate):
+    progress = _progress()
+    mutate(progress, ROADMAP[0]["id"], ROADMAP[-1]["id"])
+    _check(progress)
+
+
+def test_log_save_diffs_against_what_is_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(progress_module, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(progress_module, "LOCK_FILE", tmp_path / ".progress.lock")
+    monkeypatch.setattr(progress_log, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(progress_log, "PROGRESS_FILE", tmp_path / "progress.json")
+    monkeypatch.setattr(progress_log, "SNAPSHOT_FILE", tmp_path / "progress.snapshot.json")
+    monkeypatch.setattr(progress_log, "LOG_FILE", tmp_path / "progress.log.jsonl")
+    mid = ROADMAP[0]["id"]
+    state = {mid: DONE, "daily_log": {"2026-10-01": [mid]}}
+
+    progress_log.save(state)
+    progress_log.save(state)
+    assert len(progress_log.LOG_FILE.read_text().splitlines()) == 2
+
+    # Another writer undoes the completion; the next save must notice and redo it.
+    progress_log.append({"op": "uncomplete", "id": mid})
+    progress_log.save(state)
+    assert progress_log.load() == state
+
+
+@pytest.fixture
+def json_store(tmp_path, monkeypatch):
+    monkeypatch.delenv("PROGRESS_BACKEND", raising=False)
+    monkeypatch.setattr(progress_module, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(progress_module, "PROGRESS_FILE", tmp_path / "progress.json")
+    monkeypatch.setattr(progress_module, "LOCK_FILE", tmp_path / ".progress.lock")
+    monkeypatch.setattr(progress_module, "ARCHIVE_FILE", tmp_path / "progress_archive.json")
+    return tmp_path
+
+
+def test_load_never_archives(json_store):
+    # An unversioned file kept for some other roadmap: none of its ids are in ROADMAP.
+    path = json_store / "progress.json"
+    path.write_text('{\n  "tenant_only": {"completed": true, "completed_date": "2026-10-01"},\n'
+                    '  "daily_log": {"2026-10-01": ["tenant_only"]}\n}\n')
+    before = path.read_bytes()
+    assert progress_module.load_progress()["tenant_only"] == DONE
+    assert path.read_bytes() == before
+    assert not (json_store / "progress_archive.json").exists()
+
+
+def test_migrate_file_archives_unknown_milestones(json_store):
+    mid = ROADMAP[0]["id"]
+    (json_store / "progress.json").write_text(
+        f'{{"{mid}": {{"completed": false, "completed_date": null}}, "gone": {{"completed": true}},'
+        f' "daily_log": {{"2026-10-01": ["gone"], "2026-10-02": ["{mid}"]}}}}'
+    )
+    archived = progress_module.migrate_file()
+    assert archived == {"milestones": {"gone": {"completed": True}}, "daily_log": {"2026-10-01": ["gone"]}}
+    saved = progress_module.load_progress()
+    assert saved["schema_version"] == progress_module.SCHEMA_VERSION
+    assert "gone" not in saved and saved["daily_log"] == {"2026-10-02": [mid]}
+    assert progress_module.migrate_file() == {"milestones": {}, "daily_log": {}}
@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+
+import progress_shards
+import render_cache
+import send_reminder
+from progress import check_in, progress_hash
+from pushover_stub import PushoverStub
+
+TODAY = date(2026, 10, 17)
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server = PushoverStub().start()
+    monkeypatch.setenv("PUSHOVER_API_URL", server.url)
+    monkeypatch.setenv("PUSHOVER_API_TOKEN", "token")
+    monkeypatch.setenv("PUSHOVER_USER_KEY", "user-a,user-b")
+    yield server
+    server.stop()
+
+
+def test_receipts_survive_a_progress_change(sharded_store, stub):
+    send_reminder.send_once(TODAY)
+    assert len(stub.requests) == 2
+    before = render_cache.content_hash()
+    check_in(sharded_store[TODAY.isoformat()][0], TODAY, checked=False)  # between the two cron runs
+    assert render_cache.content_hash() != before
+    send_reminder.send_once(TODAY)
+    assert len(stub.requests) == 2
+
+
+def test_retry_sends_only_to_the_missing_recipient(sharded_store, stub):
+    stub.respond(400, body={"status": 0, "errors": ["bad user"]})  # the first send to arrive fails
+    with pytest.raises(SystemExit):
+        send_reminder.send_once(TODAY)
+    failed = stub.requests[0]["user"]
+    send_reminder.send_once(TODAY)
+    assert len(stub.requests) == 3 and stub.requests[2]["user"] == failed
+
+
+def test_forecast_flag_is_part_of_the_render_key(sharded_store, stub, monkeypatch):
+    send_reminder.send_once(TODAY)
+    monkeypatch.setenv("REMINDER_FORECAST", "1")
+    monkeypatch.setattr(send_reminder, "build_message", lambda today, prof: "with forecast")
+    send_reminder.send_once(TODAY, force=True)
+    assert stub.requests[-1]["message"] == "with forecast"
+
+
+def test_sharded_hash_reads_no_shards(sharded_store, monkeypatch):
+    def refuse(self, month):
+        raise AssertionError(f"read shard {month}")
+
+    shard = progress_shards.ShardedLog._shard
+    monkeypatch.setattr(progress_shards.ShardedLog, "_shard", refuse)
+    before = progress_hash()
+    monkeypatch.setattr(progress_shards.ShardedLog, "_shard", shard)
+    check_in(sharded_store["2026-03-02"][0], date(2026, 3, 2), checked=False)
+    assert progress_hash() != before
@@ -0,0 +1,25 @@
+import shutil
+
+import pytest
+
+import roadmap
+from roadmap import ROADMAP, ROADMAP_FILE, load_roadmap
+
+
+@pytest.mark.parametrize("junk", [
+    b"",  # EOFError
+    b"cno_such_module\nThing\n.",  # ModuleNotFoundError
+    b"\x80\x09",  # ValueError: unsupported pickle protocol
+    b"\x80\x04K\x01.",  # not a dict: AttributeError on .get
+])
+def test_bad_cache_is_rebuilt(tmp_path, monkeypatch, junk):
+    monkeypatch.setattr(roadmap, "CACHE_DIR", tmp_path / ".cache")
+    path = tmp_path / "roadmap.json"
+    shutil.copy(ROADMAP_FILE, path)
+    cache_file = roadmap._cache_path(path.resolve())
+    cache_file.parent.mkdir()
+    cache_file.write_bytes(junk)
+    milestones, _ = load_roadmap(path)
+    assert milestones == ROADMAP
+    milestones, _ = load_roadmap(path)  # from the rewritten cache
+    assert milestones == ROADMAP
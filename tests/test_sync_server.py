@@ -0,0 +1,55 @@
+import json
+import threading
+import urllib.request
+from datetime import datetime
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import sync_server
+from sync_server import LocalStore, SyncHandler, SyncQueue, validate_ops
+
+
+@pytest.fixture
+def server(sharded_store):
+    SyncHandler.queue = SyncQueue(LocalStore(), debounce=0.01, max_delay=0.05)
+    SyncHandler.origins = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SyncHandler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _request(url: str, body: dict | None = None) -> tuple[int, dict]:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, method="POST" if data else "GET")
+    with urllib.request.urlopen(req, timeout=10) as res:
+        return res.status, json.load(res)
+
+
+def test_get_progress_from_sharded_store(server, sharded_store):
+    status, body = _request(server + "/progress?since=2026-10-10")
+    assert status == 200
+    assert body["progress"]["daily_log"] == {day: ids for day, ids in sharded_store.items() if day >= "2026-10-10"}
+    assert "calc3" in body["progress"]
+
+
+def test_get_progress_default_window(server):
+    status, body = _request(server + "/progress")
+    assert status == 200
+    assert len(body["progress"]["daily_log"]) <= 8
+
+
+def test_write_then_read_back(server):
+    status, _ = _request(server + "/ops?wait=1", {"ops": [{"op": "check", "id": "calc3", "day": "2026-10-12"}]})
+    assert status == 200
+    _, body = _request(server + "/progress?since=2026-10-12")
+    assert "calc3" in body["progress"]["daily_log"]["2026-10-12"]
+
+
+def test_ops_without_a_day_use_today_in_et(monkeypatch):
+    # 23:30 in New York is already the 18th on a UTC server.
+    monkeypatch.setattr(sync_server, "now_et", lambda: datetime(2026, 10, 17, 23, 30))
+    assert validate_ops([{"op": "check", "id": "calc3"}])[0]["day"] == "2026-10-17"
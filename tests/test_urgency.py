@@ -0,0 +1,32 @@
+from datetime import date
+
+from progress import load_progress
+from snapshot import iter_snapshots, take_snapshot
+from urgency import NEGLECT_CAP, UrgencyRanker
+
+
+def test_reminder_reads_only_the_neglect_window(sharded_store):
+    progress = load_progress()
+    snap = take_snapshot(date(2026, 10, 17), progress)
+    snap.top_focus(3)
+    # 2026-10-03..2026-10-17 lies in one month.
+    assert progress["daily_log"].loaded_months() == ["2026-10"]
+
+
+def test_window_matches_full_history(sharded_store):
+    today = date(2026, 10, 17)
+    sharded = take_snapshot(today, load_progress()).top_focus(3)
+    plain = take_snapshot(today, {"daily_log": sharded_store}).top_focus(3)
+    assert sharded == plain
+
+
+def test_batch_and_single_day_rank_alike(sharded_store):
+    progress = {"daily_log": sharded_store}
+    for snap in iter_snapshots(date(2026, 6, 1), date(2026, 8, 31), progress):
+        assert snap.top_focus(3) == take_snapshot(snap.today, progress).top_focus(3)
+
+
+def test_last_checkin_is_capped():
+    ranker = UrgencyRanker({"daily_log": {"2026-10-01": ["calc3"]}})
+    assert ranker.last_checkin("calc3", date(2026, 10, 1 + NEGLECT_CAP)) == date(2026, 10, 1)
+    assert ranker.last_checkin("calc3", date(2026, 10, 2 + NEGLECT_CAP)) is None